@@ -1,50 +1,190 @@
 import os
+import glob
 import json
-import pandas as pd
+import logging
 import numpy as np
-from parse_xls import parse_xls
 from config import Config
 
+logger = logging.getLogger(__name__)
+
+# orjson encodes at C level and is much faster than stdlib json; fall back
+# to json if it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# msgpack provides the compact binary artifact; optional like orjson
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Numba is an optional JIT: when installed the hierarchy kernels compile to
+# machine code, otherwise the same functions run as plain Python
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def _maybe_jit(func):
+    return njit(cache=True)(func) if njit is not None else func
+
+# Fixed-point layout for int-encoded ARC codes: the low 10 digits hold the
+# code digits, the high digits hold (int_part_len * 100 + depth). Parents
+# therefore always sort before their children.
+_ARC_KEY_BASE = 10_000_000_000
+
+@_maybe_jit
+def _expand_arc_keys(values, depths, int_lens):
+    """Emit the fixed-point key of every code and every parent prefix."""
+    total = 0
+    for i in range(depths.shape[0]):
+        total += depths[i]
+
+    keys = np.empty(total, np.int64)
+    k = 0
+    for i in range(values.shape[0]):
+        value = values[i]
+        depth = depths[i]
+        int_len = int_lens[i]
+        while depth > 0:
+            prefix_int_len = int_len if int_len < depth else depth
+            keys[k] = (prefix_int_len * 100 + depth) * _ARC_KEY_BASE + value
+            k += 1
+            value //= 10
+            depth -= 1
+    return keys
+
+@_maybe_jit
+def _arc_parent_indices(keys):
+    """Compute the parent index of each node in a sorted unique key array."""
+    parents = np.empty(keys.shape[0], np.int32)
+    for i in range(keys.shape[0]):
+        meta = keys[i] // _ARC_KEY_BASE
+        value = keys[i] % _ARC_KEY_BASE
+        int_len = meta // 100
+        depth = meta % 100
+        if depth <= 1:
+            parents[i] = -1
+            continue
+        parent_depth = depth - 1
+        parent_int_len = int_len if int_len < parent_depth else parent_depth
+        parent_key = (parent_int_len * 100 + parent_depth) * _ARC_KEY_BASE + value // 10
+        parents[i] = np.searchsorted(keys, parent_key)
+    return parents
+
 class ARCParser:
 
     def __init__(self):
         self.file_path = Config.ARC_LIST_PATH
         self.arc_codes = None
-        self.arc_hierarchy_dict = {}
+        self.arc_codes_str = None
+
+        # Flat structure-of-arrays layout for the hierarchy: parallel arrays
+        # of codes/descriptions, a parent index per node, and CSR-style
+        # child offsets. The nested dict form is only materialized on demand.
+        self.codes = None
+        self.descriptions = None
+        self.parent = None
+        self.child_offsets = None
+        self.child_indices = None
+        self.root_indices = None
+        self._arc_hierarchy_dict = {}
+
+    @property
+    def arc_hierarchy_dict(self):
+        """Nested dict form of the hierarchy, materialized lazily from the arrays."""
+        if not self._arc_hierarchy_dict and self.codes is not None:
+            self._arc_hierarchy_dict = self._materialize_tree()
+        return self._arc_hierarchy_dict
 
     
+    def _build_arc_codes_str(self):
+        """
+        Precompute a string-keyed copy of arc_codes with normalized keys
+        (trailing zeros stripped), so hierarchy lookups are a single O(1)
+        dict get instead of a float() cast plus two lookups per node.
+        """
+        self.arc_codes_str = {
+            (str(k).rstrip('0').rstrip('.') if '.' in str(k) else str(k)): v
+            for k, v in self.arc_codes.items()
+        }
+
+    def build(self):
+        """
+        Run the full parse + hierarchy construction as one fused step.
+
+        Returns:
+            dict: The nested hierarchy (see generate_arc_hierarchy_tree).
+        """
+        self.generate_arc_dataframe()
+        return self.generate_arc_hierarchy_tree()
+
+    def _cache_path(self):
+        """
+        Build the parquet cache path for the ARC Excel file.
+
+        The cache name is keyed by the source file's mtime and size, so any
+        change to the Excel file automatically invalidates the cache.
+        """
+        stat = os.stat(self.file_path)
+        return self.file_path + f'.{stat.st_mtime_ns}.{stat.st_size}.parquet'
+
     def generate_arc_dataframe(self):
         """
         Generate a DataFrame from the ARC List Excel file.
+
+        Excel parsing is slow, so the parsed DataFrame is cached to a parquet
+        sidecar next to the xlsx file. When the sidecar is fresh (matching
+        mtime + size), it is loaded instead of re-parsing the Excel file.
         """
+        # Deferred: keeps module import light for code paths that only
+        # read the cached JSON
+        import pandas as pd
+        from parse_xls import parse_xls
+
         try:
+            cache_path = self._cache_path()
+
+            if os.path.exists(cache_path):
+                # Fast path: load the cached columnar copy
+                arc_df = pd.read_parquet(cache_path)
+                self.arc_codes = dict(zip(arc_df['ARC'], arc_df['Description']))
+                self._build_arc_codes_str()
+                return arc_df
+
             # Parse the Excel file
             arc_data = parse_xls(self.file_path)
             if arc_data is None:
                 raise ValueError("Failed to parse the Excel file.")
 
             # Extract the relevant sheet
-            arc_df = pd.DataFrame(arc_data['Sheet1'])
-            
-            # Ensure the DataFrame has proper column headers
-            # This will rename existing columns or create them if they don't exist
-            if arc_df.columns.tolist() != ['ARC', 'Description']:
-                # If the DataFrame doesn't have headers, assign them
-                # Assuming the first column is ARC and second is Description
-                if len(arc_df.columns) >= 2:
-                    arc_df.columns = ['ARC', 'Description'] + list(arc_df.columns[2:])
-                else:
-                    # If there aren't enough columns, create them
-                    if len(arc_df.columns) == 1:
-                        arc_df['Description'] = None
-                    elif len(arc_df.columns) == 0:
-                        arc_df = pd.DataFrame(columns=['ARC', 'Description'])
-
-            print(arc_df.head())  # Debugging line to check the DataFrame content
-
-            # MAP "ARC" and "Description" to a dictionary for self.arc_codes
-            self.arc_codes = arc_df.set_index('ARC')['Description'].to_dict()
-            
+            sheet = arc_data['Sheet1']
+            if len(sheet.columns) < 2:
+                raise ValueError("ARC sheet needs a code and a description column.")
+
+            # Build the arc_codes dict straight from the first two columns
+            # — the hierarchy builder only ever consumes this dict, so no
+            # set_index/to_dict round-trip is needed
+            self.arc_codes = dict(zip(sheet.iloc[:, 0], sheet.iloc[:, 1]))
+            self._build_arc_codes_str()
+
+            # Materialize the normalized two-column frame only for the
+            # return value and the parquet cache
+            arc_df = sheet.iloc[:, :2].set_axis(['ARC', 'Description'], axis=1)
+
+            logger.debug("arc head:\n%s", arc_df.head())
+
+            # Refresh the cache: drop stale sidecars, then write the new one
+            for stale in glob.glob(self.file_path + '.*.parquet'):
+                if stale != cache_path:
+                    os.remove(stale)
+            try:
+                arc_df.to_parquet(cache_path)
+            except Exception as e:
+                print(f"Warning: could not write ARC parquet cache: {e}")
+
             return arc_df
 
         except Exception as e:
@@ -62,81 +202,157 @@ class ARCParser:
         Returns:
             dict: A nested dictionary representing the hierarchical structure of the ARC codes.
         """
-        # Initialize the tree
-        hierarchy_tree = {}
-        
-        # Process each ARC code
-        for arc_code, description in self.arc_codes.items():
-            # Convert arc_code to string to handle float values
-            arc_code_str = str(arc_code)
-            
-            # Remove any trailing zeros after decimal point for cleaner representation
-            if '.' in arc_code_str:
-                arc_code_str = arc_code_str.rstrip('0').rstrip('.')
-            
-            # Create a list of all parent codes
-            parent_codes = []
-            current_code = ""
-            
-            # Handle the digits before the decimal point
-            before_decimal = arc_code_str.split('.')[0]
-            for i, digit in enumerate(before_decimal):
-                current_code += digit
-                parent_codes.append(current_code)
-            
-            # Handle the digits after the decimal point, if any
-            if '.' in arc_code_str:
-                current_code += '.'
-                after_decimal = arc_code_str.split('.')[1]
-                for digit in after_decimal:
-                    current_code += digit
-                    parent_codes.append(current_code)
-            
-            # Build hierarchy starting from the top
-            current = hierarchy_tree
-            for i, code in enumerate(parent_codes):
-                # If this is the final code (the original arc_code)
-                if i == len(parent_codes) - 1:
-                    current[code] = {
-                        "code": code,
-                        "description": description,
-                        "children": {}
-                    }
-                else:
-                    if code not in current:
-                        current[code] = {
-                            "code": code,
-                            "description": self.arc_codes.get(code) or self.arc_codes.get(float(code)) if code.replace('.', '').isdigit() else None,
-                            "children": {}
-                        }
-                    current = current[code]["children"]
-        
-        self.arc_hierarchy_dict = hierarchy_tree
-        return hierarchy_tree
+        import pandas as pd
+
+        # The string-keyed map built alongside arc_codes already holds every
+        # code normalized (trailing zeros stripped), so reuse its keys
+        # instead of re-normalizing the raw codes a second time
+        if self.arc_codes_str is None:
+            self._build_arc_codes_str()
+        codes = pd.Series(list(self.arc_codes_str.keys()))
+
+        # Prefer the int-encoded fixed-point kernels (JIT-compiled when
+        # numba is available); non-numeric codes fall back to string ops
+        digits = codes.str.replace('.', '', regex=False)
+        if bool(digits.str.isdigit().all()) and int(digits.str.len().max()) <= 10 \
+                and not bool(codes.str.startswith('0').any()):
+            ordered, parent = self._build_nodes_int(codes, digits)
+        else:
+            ordered, parent = self._build_nodes_str(codes)
+        n = len(ordered)
+
+        # Single O(1) lookup per node against the normalized string map
+        descriptions = [self.arc_codes_str.get(code) for code in ordered]
+
+        # Parallel arrays: codes, descriptions, and a parent index per node
+        # (-1 marks a root)
+        self.codes = np.array(ordered, dtype=object)
+        self.descriptions = np.array(descriptions, dtype=object)
+        self.parent = parent
+
+        # CSR-style children: offsets into child_indices, grouped by parent.
+        # Stable argsort keeps children in sorted-code order within a parent.
+        counts = np.bincount(self.parent[self.parent >= 0], minlength=n)
+        self.child_offsets = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(counts, out=self.child_offsets[1:])
+        by_parent = np.argsort(self.parent, kind='stable').astype(np.int32)
+        num_roots = int((self.parent < 0).sum())
+        self.root_indices = np.sort(by_parent[:num_roots])
+        self.child_indices = by_parent[num_roots:]
+
+        # Rebuild the nested form lazily from the new arrays
+        self._arc_hierarchy_dict = {}
+        return self.arc_hierarchy_dict
+
+    def _build_nodes_int(self, codes, digits):
+        """
+        Build the (code strings, parent indices) pair via the fixed-point
+        int kernels: every code becomes an int64 of its digits plus depth
+        and integer-part-length metadata, all parent prefixes are emitted
+        by integer division, and parents are resolved by binary search.
+        """
+        values = digits.astype(np.int64).to_numpy()
+        depths = digits.str.len().to_numpy(np.int64)
+        dot_positions = codes.str.find('.').to_numpy(np.int64)
+        int_lens = np.where(dot_positions < 0, depths, dot_positions)
+
+        keys = np.unique(_expand_arc_keys(values, depths, int_lens))
+        parent = _arc_parent_indices(keys)
+
+        # Decode the key array back into code strings
+        ordered = []
+        for key in keys:
+            meta = int(key) // _ARC_KEY_BASE
+            code_digits = str(int(key) % _ARC_KEY_BASE)
+            int_len, depth = meta // 100, meta % 100
+            if depth > int_len:
+                ordered.append(code_digits[:int_len] + '.' + code_digits[int_len:])
+            else:
+                ordered.append(code_digits)
+        return ordered, parent
+
+    def _build_nodes_str(self, codes):
+        """
+        String-based fallback: generate every parent prefix with vectorized
+        slicing and resolve parents through a code -> index dict.
+        """
+        all_codes = set(codes)
+        max_len = int(codes.str.len().max())
+        for i in range(1, max_len):
+            all_codes.update(codes.str[:i].str.rstrip('.'))
+        all_codes.discard('')
+
+        # Sort so parents always precede their children; each code's
+        # immediate parent is its own string minus the last character
+        ordered = sorted(all_codes, key=lambda c: (len(c), c))
+        code_to_idx = {code: i for i, code in enumerate(ordered)}
+        parent = np.array(
+            [code_to_idx.get(code[:-1].rstrip('.'), -1) for code in ordered],
+            dtype=np.int32
+        )
+        return ordered, parent
+
+    def _materialize_tree(self):
+        """
+        Materialize the nested {code, description, children} dict form of
+        the hierarchy from the flat arrays. Only used at serialization time.
+        """
+        nodes = [
+            {"code": code, "description": description, "children": {}}
+            for code, description in zip(self.codes, self.descriptions)
+        ]
+        for i, node in enumerate(nodes):
+            for j in self.child_indices[self.child_offsets[i]:self.child_offsets[i + 1]]:
+                node["children"][self.codes[j]] = nodes[j]
+        return {self.codes[i]: nodes[i] for i in self.root_indices}
     
-    def upload_arc_data(self, output_path=Config.ARC_JSON_PATH):
+    def upload_arc_data(self, output_path=Config.ARC_JSON_PATH, debug=False):
         """
         Upload the hierarchical tree structure to a database or other storage.
+
+        Writes a compact msgpack artifact alongside the JSON file (when
+        msgpack is installed). The JSON stays compact by default; pass
+        debug=True for an indented, human-readable dump.
         """
         # Placeholder for upload logic
         # This could involve database connections, API calls, etc.
-        
+
         parser_data = {
             "arc_hierarchy": self.arc_hierarchy_dict,
             "arc_codes": self.arc_codes
         }
 
-        # Example: Save to a JSON file
-        with open(output_path, 'w') as f:
-            json.dump(parser_data, f, indent=4)
+        # Compact binary artifact for downstream consumers that can read it
+        if msgpack is not None:
+            with open(Config.ARC_MSGPACK_PATH, 'wb') as f:
+                f.write(msgpack.packb(parser_data, use_bin_type=True))
+
+        # Save to a JSON file for the web service.
+        # Encode in one shot and write with a single call — json.dump's
+        # per-token writes are materially slower
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS
+            if debug:
+                # OPT_NON_STR_KEYS matches json.dump's coercion of numeric
+                # arc_codes keys
+                option |= orjson.OPT_INDENT_2
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(parser_data, option=option))
+        else:
+            with open(output_path, 'w') as f:
+                f.write(json.dumps(parser_data, indent=4 if debug else None))
 
     
 
 if __name__ == "__main__":
+    # Repr'ing the full codes dict / hierarchy tree is O(N); keep it behind
+    # DEBUG so production runs skip the formatting and stdout flushes
+    logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'WARNING'))
+
     parser = ARCParser()
     arc_df = parser.generate_arc_dataframe()
-    
-    print(parser.arc_codes)  # Debugging line to check the arc_codes dictionary
+
+    logger.debug("arc_codes: %s", parser.arc_codes)
     parser.generate_arc_hierarchy_tree()
-    print(parser.arc_hierarchy_dict)  # Debugging line to check the hierarchy tree
+    logger.debug("arc_hierarchy: %s", parser.arc_hierarchy_dict)
     parser.upload_arc_data()
\ No newline at end of file
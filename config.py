@@ -1,4 +1,6 @@
 import os
+import functools
+from typing import Final
 from dotenv import load_dotenv
 from datetime import datetime
 
@@ -6,27 +8,46 @@ from datetime import datetime
 load_dotenv()
 
 class Config:
-    """Base configuration class."""
+    """Base configuration class.
+
+    All paths are computed once at import time and must be treated as
+    immutable constants (annotated Final). Hot loops should bind the
+    attribute they need to a local rather than re-reading Config.X per row.
+    """
     # Set the base directory for the application
-    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+    BASE_DIR: Final = os.path.dirname(os.path.abspath(__file__))
 
     # Set the path to the excel file directory
-    EXCEL_FILE_DIR = os.path.join(BASE_DIR, 'itac_excel_files')
-    DATABASE_FILE_DIR = os.path.join(BASE_DIR, 'itac_database_files')
+    EXCEL_FILE_DIR: Final = os.path.join(BASE_DIR, 'itac_excel_files')
+    DATABASE_FILE_DIR: Final = os.path.join(BASE_DIR, 'itac_database_files')
 
     # ITAC Database State
-    DATETIME_STATE = "20250407" # YYYYMMDD format, abstract this in production
-    ITAC_DATABASE_WEBSITE = "https://itac.university/download"
-    ITAC_DATABASE_PATH = os.path.join(EXCEL_FILE_DIR, f'ITAC_Database_{DATETIME_STATE}.xls')
+    DATETIME_STATE: Final = "20250407" # YYYYMMDD format, abstract this in production
+    ITAC_DATABASE_WEBSITE: Final = "https://itac.university/download"
+    ITAC_DATABASE_PATH: Final = os.path.join(EXCEL_FILE_DIR, f'ITAC_Database_{DATETIME_STATE}.xls')
 
     # 2022 Codes for NAICS, most recent update
     # https://www.census.gov/naics/?48967
-    CENSUS_YEAR = "2022"
-    NAICS_CODES_PATH = os.path.join(EXCEL_FILE_DIR, f'NAICS_Codes.xlsx')
+    CENSUS_YEAR: Final = "2022"
+    NAICS_CODES_PATH: Final = os.path.join(EXCEL_FILE_DIR, f'NAICS_Codes.xlsx')
 
     # ARC Data Details, from teams
-    ARC_LIST_PATH = os.path.join(EXCEL_FILE_DIR, 'ARC_Codes.xlsx')
+    ARC_LIST_PATH: Final = os.path.join(EXCEL_FILE_DIR, 'ARC_Codes.xlsx')
+
+    ITAC_DATABASE_SQL_PATH: Final = os.path.join(DATABASE_FILE_DIR, f'ITAC_Database_{DATETIME_STATE}.db')
+    NAICS_HIERARCHY_JSON_PATH: Final = os.path.join(DATABASE_FILE_DIR, 'naics_hierarchy.json')
+    NAICS_PICKLE_PATH: Final = os.path.join(DATABASE_FILE_DIR, 'naics_hierarchy.pickle')
+    ARC_JSON_PATH: Final = os.path.join(DATABASE_FILE_DIR, 'arc_hierarchy.json')
+    ARC_MSGPACK_PATH: Final = os.path.join(DATABASE_FILE_DIR, 'arc_hierarchy.msgpack')
+
+    @staticmethod
+    @functools.cache
+    def database_path_for(date_state):
+        """Memoized path derivation for a specific database snapshot date."""
+        return os.path.join(Config.EXCEL_FILE_DIR, f'ITAC_Database_{date_state}.xls')
 
-    ITAC_DATABASE_SQL_PATH = os.path.join(DATABASE_FILE_DIR, f'ITAC_Database_{DATETIME_STATE}.db')
-    NAICS_HIERARCHY_JSON_PATH = os.path.join(DATABASE_FILE_DIR, 'naics_hierarchy.json')
-    ARC_JSON_PATH = os.path.join(DATABASE_FILE_DIR, 'arc_hierarchy.json')
\ No newline at end of file
+    @staticmethod
+    @functools.cache
+    def sql_path_for(date_state):
+        """Memoized path derivation for a specific SQL snapshot date."""
+        return os.path.join(Config.DATABASE_FILE_DIR, f'ITAC_Database_{date_state}.db')
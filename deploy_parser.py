@@ -1,29 +1,47 @@
 from extract_web_database import extract_web_database
-from iac_database_parser import IACDatabaseParser
-from arc_parser import ARCParser
+
+def _run_iac():
+    """Run the full IAC database parse + SQL conversion (picklable worker)."""
+    # Imported lazily so an UPDATE_DB-only run never pays the pandas import
+    from iac_database_parser import IACDatabaseParser
+
+    iac_parser = IACDatabaseParser()
+
+    iac_parser.load_database()
+    iac_parser.load_uconn_recommendations()
+    iac_parser.load_uconn_assessments()
+
+    iac_parser.convert_to_database()
+
+    iac_parser.uconn_naics_mapping.export_to_json()
+
+def _run_arc():
+    """Run the full ARC parse + hierarchy upload (picklable worker)."""
+    from arc_parser import ARCParser
+
+    parser = ARCParser()
+    parser.build()
+    parser.upload_arc_data()
 
 def deploy_parser(UPDATE_DB=False, IAC=False, ARC=False):
     if UPDATE_DB:
         if not extract_web_database():
             print("Failed to download and extract the ITAC database.")
             return
-    
-    if IAC:
-        iac_parser = IACDatabaseParser()
-
-        iac_parser.load_database()
-        iac_parser.load_uconn_recommendations()
-        iac_parser.load_uconn_assessments()
-        
-        iac_parser.convert_to_database()
-
-        iac_parser.uconn_naics_mapping.export_to_json()
-    
-    if ARC:
-        parser = ARCParser()
-        parser.generate_arc_dataframe()
-        parser.generate_arc_hierarchy_tree()
-        parser.upload_arc_data()
+
+    # The IAC and ARC steps read different workbooks and have no data
+    # dependency once the download is done, so run them on separate cores
+    if IAC and ARC:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(_run_iac), executor.submit(_run_arc)]
+            for future in futures:
+                future.result()
+    elif IAC:
+        _run_iac()
+    elif ARC:
+        _run_arc()
 
 if __name__ == "__main__":
-    deploy_parser(UPDATE_DB=True, IAC=True, ARC=True)
\ No newline at end of file
+    deploy_parser(UPDATE_DB=True, IAC=True, ARC=True)
@@ -1,9 +1,80 @@
 import os
+import json
+import hashlib
 import requests
 import zipfile
 import shutil
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config import Config
 
+# Shared session: reuses the TCP+TLS connection between the HEAD probe and
+# the GET, and retries transient server errors with backoff
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+))
+
+# Cached HTTP validators for the database zip, so unchanged files are
+# never re-downloaded
+ITAC_META_PATH = os.path.join(Config.DATABASE_FILE_DIR, '.itac_meta.json')
+
+def load_database_meta():
+    """Load the cached ETag/Last-Modified validators, or {} if absent."""
+    try:
+        with open(ITAC_META_PATH, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def save_database_meta(response, sha256=None):
+    """Persist the server's validators from a successful download response."""
+    meta = {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'sha256': sha256
+    }
+    try:
+        with open(ITAC_META_PATH, 'w') as f:
+            json.dump(meta, f)
+    except Exception as e:
+        print(f"Warning: Could not save database metadata: {str(e)}")
+
+def database_is_current(url, database_path):
+    """
+    Check whether the local database already matches the server copy.
+
+    Issues a HEAD request and compares the server's ETag/Last-Modified
+    against the cached validators from the last successful download.
+
+    Returns:
+        bool: True if the local copy is up to date and the download can
+              be skipped entirely.
+    """
+    meta = load_database_meta()
+    if not meta or not os.path.exists(database_path):
+        return False
+
+    try:
+        head = _session.head(url, allow_redirects=True, timeout=(5, 60))
+        if head.status_code != 200:
+            return False
+
+        etag = head.headers.get('ETag')
+        last_modified = head.headers.get('Last-Modified')
+        if etag and etag == meta.get('etag'):
+            return True
+        if last_modified and last_modified == meta.get('last_modified'):
+            return True
+    except Exception as e:
+        print(f"Warning: Could not check database freshness: {str(e)}")
+
+    return False
+
 def ensure_directory_exists(directory_path):
     """Ensure the specified directory exists, creating it if necessary."""
     if not os.path.exists(directory_path):
@@ -17,51 +88,84 @@ def download_database_file(url, save_path):
     Args:
         url (str): URL to download the file from
         save_path (str): Where to save the downloaded ZIP file
-        
+
     Returns:
-        bool: True if successful, False otherwise
+        The SHA256 hexdigest of the downloaded file, the string
+        'not_modified' if the server reported the cached copy is still
+        current (304), or False on failure.
     """
     try:
         print(f"Downloading database from {url}")
-        response = requests.get(url, stream=True)
+        # The payload is already a zip, so ask the server not to gzip it again
+        headers = {'Accept-Encoding': 'identity'}
+
+        # Attach cached validators so an unchanged file comes back as a 304
+        # (only when we still have the previously extracted database)
+        if os.path.exists(Config.ITAC_DATABASE_PATH):
+            meta = load_database_meta()
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        response = _session.get(url, stream=True, headers=headers, timeout=(5, 60))
+        if response.status_code == 304:
+            print("Database unchanged on server (304), skipping download")
+            return 'not_modified'
         if response.status_code != 200:
             print(f"Failed to download file: Status code {response.status_code}")
             return False
-        
-        # Save the file
+
+        # Save the file in large chunks straight off the raw socket
+        # (fewer Python-level iterations and write syscalls than iter_content),
+        # hashing each chunk as it lands so the digest is free vs. the I/O
+        digest = hashlib.sha256()
+        response.raw.decode_content = True
         with open(save_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
+            while True:
+                chunk = response.raw.read(1024 * 1024)
+                if not chunk:
+                    break
+                digest.update(chunk)
                 f.write(chunk)
-        
+
+        # Remember the server's validators and content digest for the next run
+        sha256 = digest.hexdigest()
+        save_database_meta(response, sha256)
+
         print(f"Download completed and saved to {save_path}")
-        return True
+        return sha256
     except Exception as e:
         print(f"Error downloading file: {str(e)}")
         return False
 
-def extract_zip_file(zip_path, extract_path):
+def extract_zip_file(zip_path, destination_path):
     """
-    Extract the downloaded ZIP file containing the ITAC database.
-    
+    Extract the XLS database member from the downloaded ZIP file.
+
+    The XLS member is streamed straight to the destination path, so the
+    file is only written to disk once (no temp-dir extract + copy).
+
     Args:
         zip_path (str): Path to the ZIP file
-        extract_path (str): Directory to extract the contents to
-        
+        destination_path (str): Final path to write the XLS file to
+
     Returns:
         str: Path to the extracted XLS file or None if failed
     """
     try:
         print(f"Extracting ZIP file {zip_path}")
-        
+
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_path)
-        
-        # Look for the XLS file in the extracted directory
-        for file in os.listdir(extract_path):
-            if file.endswith('.xls'):
-                return os.path.join(extract_path, file)
-        
-        print("No XLS file found in the extracted contents")
+            # Only the central directory is inspected; no other member is
+            # ever decompressed or written
+            for info in zip_ref.infolist():
+                if info.filename.lower().endswith('.xls'):
+                    with zip_ref.open(info) as src, open(destination_path, 'wb') as dst:
+                        shutil.copyfileobj(src, dst, 1 << 20)
+                    return destination_path
+
+        print("No XLS file found in the ZIP contents")
         return None
     except Exception as e:
         print(f"Error extracting ZIP file: {str(e)}")
@@ -76,36 +180,48 @@ def extract_web_database():
     """
     # Set up the necessary paths
     zip_download_path = os.path.join(Config.EXCEL_FILE_DIR, 'ITAC_Database.zip')
-    temp_extract_path = os.path.join(Config.EXCEL_FILE_DIR, 'temp_extract')
     final_database_path = Config.ITAC_DATABASE_PATH
-    
+
     # Ensure directories exist
     ensure_directory_exists(Config.EXCEL_FILE_DIR)
-    ensure_directory_exists(temp_extract_path)
-    
+
     try:
-        # Step 1: Download the database zip file
+        # Step 1: Download the database zip file (skipped when the server
+        # copy is unchanged since the last run)
         download_url = "https://itac.university/storage/ITAC_Database.zip"
-        if not download_database_file(download_url, zip_download_path):
+
+        if database_is_current(download_url, final_database_path):
+            print("Local database is already up to date, skipping download")
+            return True
+
+        previous_sha256 = load_database_meta().get('sha256')
+
+        download_status = download_database_file(download_url, zip_download_path)
+        if download_status == 'not_modified':
+            return True
+        if not download_status:
             return False
-        
-        # Step 2: Extract the zip file
-        xls_path = extract_zip_file(zip_download_path, temp_extract_path)
+
+        # Byte-identical zip to the last run: the extracted XLS is already
+        # in place, so skip the unzip
+        if download_status == previous_sha256 and os.path.exists(final_database_path):
+            print("Downloaded zip is identical to the previous run, skipping extract")
+            os.remove(zip_download_path)
+            return True
+
+        # Step 2: Extract the XLS member straight to its final destination
+        xls_path = extract_zip_file(zip_download_path, final_database_path)
         if not xls_path:
             return False
-        
-        # Step 3: Move the XLS file to the final destination
-        shutil.copy2(xls_path, final_database_path)
-        print(f"Successfully copied database to {final_database_path}")
-        
+        print(f"Successfully extracted database to {final_database_path}")
+
         # Clean up
         try:
             os.remove(zip_download_path)
-            shutil.rmtree(temp_extract_path)
             print("Cleaned up temporary files")
         except Exception as e:
             print(f"Warning: Could not clean up temporary files: {str(e)}")
-        
+
         return True
     except Exception as e:
         print(f"Error in extract_web_database: {str(e)}")
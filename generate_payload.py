@@ -2,34 +2,164 @@ import os
 import requests
 import re
 import json
+import threading
 import traceback
 import sqlite3
+from functools import lru_cache
 from config import Config
-from flask import Flask, request, jsonify
+from flask import Flask, request, Response, stream_with_context
 from flask_cors import CORS
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 app = Flask(__name__)
 CORS(app)
 
+# gzip responses when the client accepts it; the JSON payloads here are
+# highly repetitive (same keys in every dict) and compress extremely well
+try:
+    from flask_compress import Compress
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    Compress(app)
+except ImportError:
+    pass
+
+# Compiled once; /aggregates validates fiscal_year against it per request
+_FY_RE = re.compile(r"^\s*(<=|>=|=)?\s*(\d{4})\s*$")
+
 # Get directory paths
 ITAC_DB = Config.ITAC_DATABASE_SQL_PATH
 NAICS_DB = Config.NAICS_HIERARCHY_JSON_PATH
 ARC_DB = Config.ARC_JSON_PATH
 
-def generate_entire_payload(arc_data, naics_data):
-    # Connect to SQLite database
-    conn = sqlite3.connect(ITAC_DB)
-    conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+# The hierarchy files never change during process lifetime, so each is
+# read and parsed exactly once. The lock keeps the first load race-free
+# under Flask's threaded server.
+_load_lock = threading.Lock()
+
+def _load_json(path):
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+# One SQLite connection per thread: avoids re-opening the file and
+# re-warming the page cache on every request. The workload is read-only,
+# so query_only is enforced and a big mmap'd cache is safe.
+_tls = threading.local()
+_prepare_lock = threading.Lock()
+_db_prepared = False
+
+def _prepare_database():
+    """One-time writable pass over the database before any reads.
+
+    Creates the indexes the /aggregates query plans against:
+    recommendations(arc, fiscal_year) lets the GROUP BY r.arc come out
+    index-ordered (no sort) and covers the arc-prefix and fiscal-year
+    predicates; assessments(center, state) narrows the join when those
+    filters are set.
+
+    Also materializes arc_titles/naics_titles lookup tables (one row per
+    distinct code, with the description the Python helpers would return)
+    so queries can emit descriptions via a join instead of a per-row
+    Python call. Runs on a throwaway writable connection because the
+    per-thread ones are opened query_only.
+    """
+    global _db_prepared
+    if _db_prepared:
+        return
+    with _prepare_lock:
+        if _db_prepared:
+            return
+        try:
+            conn = sqlite3.connect(ITAC_DB)
+            conn.executescript(
+                "CREATE INDEX IF NOT EXISTS ix_recommendations_arc_fiscal_year"
+                " ON recommendations(arc, fiscal_year);"
+                "CREATE INDEX IF NOT EXISTS ix_assessments_center_state"
+                " ON assessments(center, state);"
+                "CREATE TABLE IF NOT EXISTS arc_titles (code, title);"
+                "CREATE TABLE IF NOT EXISTS naics_titles (code, title);"
+                "DELETE FROM arc_titles;"
+                "DELETE FROM naics_titles;"
+            )
+            conn.executemany(
+                "INSERT INTO arc_titles VALUES (?, ?)",
+                [(code, get_arc_description(code))
+                 for (code,) in conn.execute(
+                     "SELECT DISTINCT arc FROM recommendations WHERE arc IS NOT NULL")]
+            )
+            conn.executemany(
+                "INSERT INTO naics_titles VALUES (?, ?)",
+                [(code, get_naics_description(code))
+                 for (code,) in conn.execute(
+                     "SELECT DISTINCT naics FROM assessments WHERE naics IS NOT NULL")]
+            )
+            conn.executescript(
+                "CREATE INDEX IF NOT EXISTS ix_arc_titles_code ON arc_titles(code);"
+                "CREATE INDEX IF NOT EXISTS ix_naics_titles_code ON naics_titles(code);"
+                "ANALYZE;"
+            )
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not prepare database: {str(e)}")
+        _db_prepared = True
+
+def _conn():
+    conn = getattr(_tls, 'conn', None)
+    if conn is None:
+        _prepare_database()
+        conn = sqlite3.connect(ITAC_DB, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        conn.executescript(
+            "PRAGMA query_only=1;"
+            "PRAGMA mmap_size=268435456;"
+            "PRAGMA cache_size=-65536;"
+            "PRAGMA temp_store=MEMORY;"
+        )
+        _tls.conn = conn
+    return conn
+
+@lru_cache(maxsize=1)
+def _naics():
+    """Load the NAICS hierarchy JSON once per process."""
+    with _load_lock:
+        return _load_json(NAICS_DB)
+
+@lru_cache(maxsize=1)
+def _arc():
+    """Load the ARC hierarchy JSON once per process."""
+    with _load_lock:
+        return _load_json(ARC_DB)
+
+def iter_entire_payload(arc_data, naics_data):
+    """Yield each formatted recommendation row as it comes off the cursor.
+
+    Keeping this a generator means a caller that streams (the /all route)
+    never holds more than one row in memory.
+    """
+    # Shared per-thread SQLite connection
+    conn = _conn()
     cursor = conn.cursor()
-    
+    # Plain tuples + big fetch batches: skips the Row-factory object per
+    # row and the per-field name lookups below
+    cursor.row_factory = None
+    cursor.arraysize = 1000
+
     # Query for all recommendations with their assessment data,
-    # now including center and state
+    # now including center and state. Descriptions come joined in from the
+    # startup lookup tables rather than N per-row Python lookups.
     query = """
-    SELECT 
-        r.arc, 
-        r.assessment_id, 
-        r.imp_status, 
-        r.imp_cost, 
+    SELECT
+        r.arc,
+        r.assessment_id,
+        r.imp_status,
+        r.imp_cost,
         r.fiscal_year,
         a.center,
         a.state,
@@ -37,45 +167,46 @@ def generate_entire_payload(arc_data, naics_data):
         r.p_conserved_mmbtu,
         r.total_energy_saved,
         a.naics,
-        a.products
-    FROM 
+        a.products,
+        COALESCE(nt.title, 'Unknown'),
+        COALESCE(at.title, 'Unknown')
+    FROM
         recommendations r
-    JOIN 
+    JOIN
         assessments a ON r.assessment_id = a.id
+    LEFT JOIN arc_titles   at ON at.code = r.arc
+    LEFT JOIN naics_titles nt ON nt.code = a.naics
     """
-    
+
     cursor.execute(query)
-    results = cursor.fetchall()
-    
-    # Format the results as specified
-    formatted_results = []
-    for row in results:
-        formatted_result = {
-            "number_arc": row["arc"],
-            "number_naics": row["naics"],
-            "description_naics": get_naics_description(row["naics"], naics_data),
-            "description_arc": get_arc_description(row["arc"], arc_data),
-            "product_naics": row["products"],
-            
+
+    # Format the results as specified, iterating the cursor directly so
+    # rows arrive in C-level batches and unpack positionally
+    for (arc, assessment_id, imp_status, imp_cost, fiscal_year, center, state,
+         total_savings, p_conserved_mmbtu, total_energy_saved, naics, products,
+         description_naics, description_arc) in cursor:
+        yield {
+            "number_arc": arc,
+            "number_naics": naics,
+            "description_naics": description_naics,
+            "description_arc": description_arc,
+            "product_naics": products,
+
             # newly added fields:
-            "center":       row["center"],
-            "state":        row["state"],
-            "fiscal_year":  row["fiscal_year"],
-            
-            "implemented":  row["imp_status"] == "I",
-            "cost":         row["imp_cost"],
-            "total_savings":       row["total_savings"],
-            "p_conserved_mmbtu":   row["p_conserved_mmbtu"],
-            "energy_savings":      row["total_energy_saved"],
+            "center":       center,
+            "state":        state,
+            "fiscal_year":  fiscal_year,
+
+            "implemented":  imp_status == "I",
+            "cost":         imp_cost,
+            "total_savings":       total_savings,
+            "p_conserved_mmbtu":   p_conserved_mmbtu,
+            "energy_savings":      total_energy_saved,
         }
-        formatted_results.append(formatted_result)
-    
-    conn.close()
-    return formatted_results
 
-# ──────────────────────────────────────────────────────────────────────────────
-def get_arc_description(code: str | int, arc_data: dict) -> str:
-    return arc_data.get("arc_codes", {}).get(str(code), "ARC description not found")
+def generate_entire_payload(arc_data, naics_data):
+    return list(iter_entire_payload(arc_data, naics_data))
+
 # ──────────────────────────────────────────────────────────────────────────────
 def _dollar(v: float | int | None) -> str:
     return f"${(v or 0):,.0f}"
@@ -94,110 +225,125 @@ def _safe(val, places: int):
     return round(val, places) if val is not None else 0
 
 
-def get_naics_description(naics_code, naics_data):
-    """Find the description for a NAICS code in the hierarchy"""
+def _flatten_naics(node, flat):
+    """One DFS over the hierarchy collecting every code -> title pair."""
+    code = node.get("code")
+    if code is not None:
+        flat[str(code)] = node.get("title")
+    for child in node.get("children", {}).values():
+        _flatten_naics(child, flat)
+
+@lru_cache(maxsize=1)
+def _naics_title_index():
+    """Flat {code: title} index of the NAICS hierarchy, built once."""
+    flat = {}
+    _flatten_naics(_naics(), flat)
+    return flat
+
+@lru_cache(maxsize=1)
+def _arc_codes():
+    """The arc_codes description dict, hoisted out of per-row calls."""
+    return _arc().get("arc_codes", {})
+
+def get_naics_description(naics_code, naics_data=None):
+    """Find the description for a NAICS code via the flat index.
+
+    The same codes repeat across thousands of recommendations, so the old
+    recursive tree walk is replaced with a single O(1) dict lookup.
+    """
     if not naics_code:
         return "Unknown"
-    
+
     # Convert to string and handle decimal points
     try:
         naics_str = str(int(float(naics_code)))
     except (ValueError, TypeError):
         naics_str = str(naics_code)
-    
-    # Search through the NAICS hierarchy
-    def search_code(node, code):
-        # Check if this node matches the code
-        if node.get("code") == code:
-            return node.get("title")
-        
-        # Check children
-        if "children" in node:
-            # Direct lookup in children dictionary
-            if code in node["children"]:
-                return node["children"][code].get("title")
-            
-            # Recursive search through children
-            for child_code, child in node["children"].items():
-                if code.startswith(child_code):
-                    result = search_code(child, code)
-                    if result:
-                        return result
-        
-        return None
-    
-    description = search_code(naics_data, naics_str)
+
+    description = _naics_title_index().get(naics_str)
     return description if description else "NAICS description not found"
 
-def get_arc_description(arc_code, arc_data):
+def get_arc_description(arc_code, arc_data=None):
     if not arc_code:
         return "Unknown"
 
-    return arc_data.get("arc_codes", {}).get(str(arc_code), "ARC description not found")
-
-def get_arc_data_by_precision(arc_code, arc_data):
+    if not isinstance(arc_code, str):
+        arc_code = str(arc_code)
+    return _arc_codes().get(arc_code, "ARC description not found")
+
+def _collect_arc_nodes(level, index):
+    """One DFS over an arc_hierarchy level collecting every code -> node pair."""
+    for code, node in level.items():
+        index[str(code)] = node
+        children = node.get('children')
+        if children:
+            _collect_arc_nodes(children, index)
+
+@lru_cache(maxsize=1)
+def _arc_node_index():
+    """Flat {code: node} index of the ARC hierarchy, built once."""
+    index = {}
+    _collect_arc_nodes(_arc().get('arc_hierarchy', {}), index)
+    return index
+
+def get_arc_data_by_precision(arc_code, arc_data=None):
     """
     Find and return data from the ARC hierarchy based on a specific ARC code.
-    
+
+    The hierarchy is keyed by exact code strings at every level, so instead
+    of walking it a level at a time per request, look the code up in a flat
+    index built once on first use.
+
     Parameters:
     - arc_code (str): The ARC code to search for (e.g., "2.1", "2.11", "2.111", etc.)
-    - arc_data (dict): The JSON data containing the ARC hierarchy
-    
+    - arc_data (dict): Unused, kept for call-site compatibility
+
     Returns:
-    - dict: The subset of ARC data corresponding to the provided code.
+    - dict: The subset of ARC data corresponding to the provided code,
+            or {} if the code is not in the hierarchy.
     """
+    return _arc_node_index().get(str(arc_code).strip(), {})
 
-    arc_code = str(arc_code).strip()
+def extract_code_descriptions(data, results=None):
+    """Collect every code -> description pair reachable from data.
 
-    try:
-        hierarchy = arc_data['arc_hierarchy']
+    Iterative DFS with an explicit stack: no recursion frames, and no
+    per-level function calls while walking the tree.
+    """
+    if results is None:
+        results = {}
 
-        arc_code_digits = [digit for digit in arc_code if digit.isdigit()]
-        arc_category = arc_code_digits[0] if arc_code_digits else None
-        arc_code_digits = arc_code_digits[1:] if len(arc_code_digits) > 1 else None
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            continue
 
-        level = hierarchy[arc_category]
-        
-        if arc_category and not arc_code_digits:
-            print("No digits found in arc_code, returning level")
-            return level
-        
+        # Check if this is a dictionary with code and description
+        if "code" in node and "description" in node:
+            results[node["code"]] = node["description"]
 
-        level = level.get('children', {})
-        arc_category += '.'
+            # If there are children, process them too
+            children = node.get("children")
+            if isinstance(children, dict):
+                stack.extend(children.values())
 
-        for digit in arc_code_digits:
-            arc_category += digit
+        # If data is a dictionary but not the expected format, check all values
+        else:
+            stack.extend(node.values())
 
-            if arc_code in level:
-                return level[arc_code]
-            
-            level = level[arc_category].get('children', {})
+    return results
 
+@lru_cache(maxsize=128)
+def _code_descriptions_for(arc_precision):
+    """Code -> description map for an arc_precision slice, walked once.
 
-    except (KeyError, IndexError):
-        return {}
-    
-def extract_code_descriptions(data, results=None):
-    if results is None:
-        results = {}
-    
-    # Check if this is a dictionary with code and description
-    if isinstance(data, dict) and "code" in data and "description" in data:
-        # Add this code-description pair to results
-        results[data["code"]] = data["description"]
-        
-        # If there are children, process them too
-        if "children" in data and isinstance(data["children"], dict):
-            for child_key, child_data in data["children"].items():
-                extract_code_descriptions(child_data, results)
-    
-    # If data is a dictionary but not the expected format, check all values
-    elif isinstance(data, dict):
-        for key, value in data.items():
-            extract_code_descriptions(value, results)
-            
-    return results
+    The same precisions repeat across /recomendations calls, so cache the
+    extracted map instead of re-walking the hierarchy per request.
+    """
+    if not arc_precision:
+        return extract_code_descriptions(_arc())
+    return extract_code_descriptions(get_arc_data_by_precision(arc_precision))
 
 def generate_top_recommendations(arc_precision=None, fiscal_year=None):
     fiscal_year_range = []
@@ -207,229 +353,211 @@ def generate_top_recommendations(arc_precision=None, fiscal_year=None):
     elif type(fiscal_year) == list:
         fiscal_year_range = fiscal_year
 
-    with open(NAICS_DB, 'r') as f:
-        naics_data = json.load(f)
-
-    with open(ARC_DB, 'r') as f:
-        arc_data = json.load(f)
+    sectioned_arc_recomendations = _code_descriptions_for(arc_precision)
 
-    
-    if not arc_precision:
-        recomendation_load = arc_data.copy()
-    else:
-        recomendation_load = get_arc_data_by_precision(arc_precision, arc_data) if arc_precision else None
-
-    sectioned_arc_recomendations = extract_code_descriptions(recomendation_load)
-    
-    recomendations = {}
-    
-    conn = sqlite3.connect(ITAC_DB)
-    conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+    conn = _conn()
     cursor = conn.cursor()
-    
-    # Get all recommendations from the database
-    query = "SELECT * FROM recommendations"
-    cursor.execute(query)
+
+    # Aggregate per ARC inside SQLite instead of pulling every row into
+    # Python and looping. COALESCE(x, 0) keeps the old null-as-zero
+    # semantics where missing values count towards the averages.
+    query = """
+    SELECT
+        arc,
+        AVG(COALESCE(total_savings, 0)) AS average_savings,
+        AVG(COALESCE(imp_cost, 0)) AS average_cost,
+        AVG(COALESCE(payback, 0)) AS average_payback,
+        SUM(CASE WHEN imp_status = 'I' THEN 1 ELSE 0 END) AS implemented_count,
+        COUNT(*) AS times_recommended
+    FROM recommendations
+    WHERE arc IS NOT NULL
+    """
+    params = []
+    if fiscal_year_range:
+        placeholders = ','.join('?' * len(fiscal_year_range))
+        query += f" AND fiscal_year IN ({placeholders})"
+        params.extend(fiscal_year_range)
+    query += " GROUP BY arc"
+
+    cursor.execute(query, params)
     rows = cursor.fetchall()
-    
-    # Process each row
-    for row in rows:
-        arc_code = row['arc']
-        
-        # Skip if arc_code is None
-        if arc_code is None:
-            continue
-        
-        # Convert arc_code to string for dictionary lookup
+
+    # One pass over the (already aggregated) per-arc rows; arcs outside
+    # the requested hierarchy slice are dropped here
+    result = {}
+    for arc_code, avg_savings, avg_cost, avg_payback, implemented_count, times_recommended in rows:
         arc_key = str(arc_code)
-        
-        # Skip if arc_key not in sectioned_arc_recommendations
         if arc_key not in sectioned_arc_recomendations:
-            print(f"ARC code {arc_key} not found in sectioned recommendations.")
             continue
-        
-        print(f"Processing ARC code: {arc_key}")
 
-        # Check fiscal year if enabled
-        if fiscal_year_range and row['fiscal_year'] not in fiscal_year_range:
-            continue
-        
-        # Get values from the row, replacing nulls with 0
-        savings = row['total_savings'] if row['total_savings'] is not None else 0
-        payback = row['payback'] if row['payback'] is not None else 0
-        cost = row['imp_cost'] if row['imp_cost'] is not None else 0
-        implementation_status = 1 if row['imp_status'] == 'I' else 0
-
-        # Get or create the recommendation entry
-        if arc_key not in recomendations:
-            recomendations[arc_key] = {
-                'description': sectioned_arc_recomendations[arc_key],
-                'savings': [],
-                'payback': [],
-                'cost': [],
-                'implementation_status': []
-            }
-        
-        # Add values to the arrays
-        recomendations[arc_key]['savings'].append(savings)
-        recomendations[arc_key]['payback'].append(payback)
-        recomendations[arc_key]['cost'].append(cost)
-        recomendations[arc_key]['implementation_status'].append(implementation_status)
-    
-    conn.close()
-    
-    # Generate the final result dictionary
-    result = {}
-    for arc_code, data in recomendations.items():
-        savings_array = data['savings']
-        cost_array = data['cost']
-        payback_array = data['payback']
-        implementation_status_array = data['implementation_status']
-        
-        # Calculate averages and implementation rate
-        avg_savings = sum(savings_array) / len(savings_array) if savings_array else 0
-        avg_cost = sum(cost_array) / len(cost_array) if cost_array else 0
-        avg_payback = sum(payback_array) / len(payback_array) if payback_array else 0
-        
-        implementation_count = sum(implementation_status_array)
-        total_count = len(implementation_status_array)
-        implementation_rate = (implementation_count / total_count * 100) if total_count > 0 else 0
-        implementation_rate = round(implementation_rate, 1)  # Round to 1 decimal place
-        
-        # Add to result
-        result[arc_code] = {
-            'arc_code': arc_code,
-            'description': data['description'],
+        implementation_rate = round(implemented_count / times_recommended * 100, 1)
+
+        result[arc_key] = {
+            'arc_code': arc_key,
+            'description': sectioned_arc_recomendations[arc_key],
             'average_savings': avg_savings,
             'average_cost': avg_cost,
             'average_payback': avg_payback,
             'implementation_rate': implementation_rate,
-            'times_recommended': len(savings_array)
+            'times_recommended': times_recommended
         }
-    
-    return result    
+
+    return result
+
+@app.route('/all', methods=['GET'])
+def get_entire_payload():
+    """Stream every recommendation row as a JSON array.
+
+    jsonify would materialize all ~160k row dicts, serialize them into one
+    big string, and only then start sending. Instead SQLite's JSON1
+    json_object emits each row already serialized (descriptions come from
+    the arc_titles/naics_titles lookup tables, so no per-row Python call),
+    and the route just streams the strings with separators. Memory stays
+    flat and the client can start parsing immediately.
+    """
+    def generate():
+        conn = _conn()
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.arraysize = 1000
+        cursor.execute("""
+        SELECT json_object(
+            'number_arc',        r.arc,
+            'number_naics',      a.naics,
+            'description_naics', COALESCE(nt.title, 'Unknown'),
+            'description_arc',   COALESCE(at.title, 'Unknown'),
+            'product_naics',     a.products,
+            'center',            a.center,
+            'state',             a.state,
+            'fiscal_year',       r.fiscal_year,
+            'implemented',       json(CASE WHEN r.imp_status = 'I' THEN 'true' ELSE 'false' END),
+            'cost',              r.imp_cost,
+            'total_savings',     r.total_savings,
+            'p_conserved_mmbtu', r.p_conserved_mmbtu,
+            'energy_savings',    r.total_energy_saved
+        )
+        FROM recommendations r
+        JOIN assessments  a  ON r.assessment_id = a.id
+        LEFT JOIN arc_titles   at ON at.code = r.arc
+        LEFT JOIN naics_titles nt ON nt.code = a.naics
+        """)
+
+        yield b'['
+        first = True
+        for (row_json,) in cursor:
+            yield row_json.encode() if first else b',' + row_json.encode()
+            first = False
+        yield b']'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
 
 @app.route('/arc/<arc_code>', methods=['GET'])
 def get_arc_subset(arc_code):
     try:
-        # Load ARC data
-        with open(ARC_DB, 'r') as f:
-            arc_data = json.load(f)
-        
-        
+        # Load ARC data (cached for the process lifetime)
+        arc_data = _arc()
+
+
         # Get the subset of ARC data for the requested code
         result = get_arc_data_by_precision(arc_code, arc_data)
         
         if result and isinstance(result, dict):
             # If the result has children, we need to format it
-            return jsonify({arc_code: {"code": arc_code, "description": result.get("description", "No description available"), "children": result["children"]}} ), 200
+            return _ojson({arc_code: {"code": arc_code, "description": result.get("description", "No description available"), "children": result["children"]}})
             
         else:
-            return jsonify({"error": "No data found for the given ARC code"}), 404
+            return _ojson({"error": "No data found for the given ARC code"}, 404)
             
     except Exception as e:
-        return jsonify({"error": str(e), "trace": str(traceback.format_exc())}), 500
+        return _ojson({"error": str(e), "trace": str(traceback.format_exc())}, 500)
+
+# The three read endpoints below are pure functions of the database file
+# and their query params, so each caches its already-serialized response
+# bytes. The DB file's mtime is part of every cache key: redeploying a new
+# database invalidates everything without an explicit flush.
+
+def _json_bytes(obj):
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
+
+def _ojson(obj, status=200):
+    """orjson-serialized Response; drop-in for the old jsonify(...), status."""
+    return Response(_json_bytes(obj), status=status, mimetype='application/json')
+
+def _db_stamp():
+    try:
+        return os.stat(ITAC_DB).st_mtime_ns
+    except OSError:
+        return 0
+
+@lru_cache(maxsize=256)
+def _recommendations_response(arc_precision, fiscal_year, stamp):
+    # Convert fiscal_year to int or list of ints
+    if fiscal_year:
+        if ',' in fiscal_year:
+            fiscal_year = [int(year.strip()) for year in fiscal_year.split(',')]
+        else:
+            fiscal_year = int(fiscal_year)
+
+    # Convert arc_precision to appropriate type if needed
+    if arc_precision and arc_precision.isdigit():
+        arc_precision = int(arc_precision)
 
-@app.route('/recomendations', methods=['GET'])   
+    recommendations = generate_top_recommendations(arc_precision, fiscal_year)
+
+    return _json_bytes({"success": True, "data": recommendations})
+
+@app.route('/recomendations', methods=['GET'])
 def get_top_recommendations():
     try:
-        # Get parameters from the request
-        arc_precision = request.args.get('arc_precision')
-        fiscal_year = request.args.get('fiscal_year')
-
-        # Convert fiscal_year to int or list of ints
-        if fiscal_year:
-            if ',' in fiscal_year:
-                fiscal_year = [int(year.strip()) for year in fiscal_year.split(',')]
-            else:
-                fiscal_year = int(fiscal_year)
-        
-        # Convert arc_precision to appropriate type if needed
-        if arc_precision and arc_precision.isdigit():
-            arc_precision = int(arc_precision)
-        
-        # Generate top recommendations
-        recommendations = generate_top_recommendations(arc_precision, fiscal_year)
-        
-        return jsonify({"success": True, "data": recommendations}), 200
-    
+        body = _recommendations_response(
+            request.args.get('arc_precision'),
+            request.args.get('fiscal_year'),
+            _db_stamp()
+        )
+        return Response(body, mimetype='application/json'), 200
+
     except ValueError as e:
         # Handle parameter conversion errors
-        return jsonify({"success": False, "error": f"Invalid parameter: {str(e)}"}), 400
-    
+        return _ojson({"success": False, "error": f"Invalid parameter: {str(e)}"}, 400)
+
     except Exception as e:
         # Handle any other errors
-        return jsonify({"success": False, "error": str(e)}), 500
-    except Exception as e:
-        return jsonify({"error": str(e), "trace": str(traceback.format_exc())}), 500
+        return _ojson({"success": False, "error": str(e)}, 500)
 
-@app.route("/aggregates", methods=["GET"])
-def get_aggregates_by_arc():
-    try:
-        center   = request.args.get("center")
-        state    = request.args.get("state")
-        fy_param = request.args.get("fiscal_year")
-        arc_code = request.args.get("arc")
-
-        where, params = [], []
-        if center:
-            where.append("a.center = ?");   params.append(center)
-        if state:
-            where.append("a.state  = ?");   params.append(state)
-
-        # ── FIX: filter on recommendation year (r.fiscal_year), not a.fiscal_year ──
-        if fy_param:
-            m = re.match(r"^\s*(<=|>=|=)?\s*(\d{4})\s*$", fy_param)
-            if not m:
-                return jsonify({
-                    "success": False,
-                    "error": "Bad fiscal_year (ex: =2023 | >=2020 | <=2018)"
-                }), 400
-
-            op, yr = m.group(1) or "=", int(m.group(2))
-            where.append(f"r.fiscal_year {op} ?")
-            params.append(yr)
-
-        # prefix‐match ARC codes as before
-        if arc_code:
-            arc_code = arc_code.strip()
-            where.append("r.arc LIKE ?")
-            params.append(f"{arc_code}%")
-
-        where_sql = f"WHERE {' AND '.join(where)}" if where else ""
-
-        query = f"""
-        SELECT r.arc                                   AS arc_code,
-            AVG(r.total_savings)                    AS average_savings,
-            -- implemented OR blank rows only:
-          CASE WHEN SUM(CASE WHEN (r.imp_status='I' OR r.imp_status IS NULL
-                                        OR r.imp_status='' OR r.imp_status='N') THEN 1 END)=0
-                THEN 0
-                ELSE SUM(CASE WHEN (r.imp_status='I' OR r.imp_status IS NULL
-                                        OR r.imp_status='' OR r.imp_status='N') THEN r.imp_cost END)*1.0
-                        / SUM(CASE WHEN (r.imp_status='I' OR r.imp_status IS NULL
-                                        OR r.imp_status='' OR r.imp_status='N') THEN 1 END)
-          END                                     AS average_cost,
-          CASE 
-                WHEN COUNT(*)=0 THEN 0
-                ELSE CAST(
-                    AVG(
-                        CASE
-                        WHEN r.p_saved > 0
-                            THEN CAST((COALESCE(r.imp_cost,0)*1.0/r.p_saved)*10 AS INTEGER)/10.0
-                        ELSE NULL
-                        END
-                    ) * 10
-                    AS INTEGER
-                    ) / 10.0
-            END                                  AS average_payback,
-          CASE 
-                WHEN SUM(CASE WHEN r.imp_status IN ('I','N') THEN 1 END)=0 
-                THEN 0 
-                ELSE SUM(CASE WHEN r.imp_status='I' THEN 1 END)*100.0
-                    / SUM(CASE WHEN r.imp_status IN ('I','N') THEN 1 END)
-            END                                 AS implementation_rate,
-          COUNT(*)                                 AS times_recommended
+@lru_cache(maxsize=32)
+def _aggregate_sql(where_clauses):
+    """
+    Materialize the /aggregates SQL once per filter combination.
+
+    There are only a handful of possible WHERE shapes (center, state,
+    fiscal-year op, arc prefix), so caching on the clause tuple returns
+    the same string object every time — which is what lets sqlite3's
+    per-connection statement cache skip re-parsing and re-planning.
+    """
+    where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+
+    # FILTER clauses evaluate each imp_status predicate once per row,
+    # where the old nested CASE WHEN repeated the same test up to four
+    # times. SUM(1) FILTER keeps the old SUM(CASE ...) NULL-when-empty
+    # semantics (COUNT would yield 0).
+    return f"""
+        SELECT r.arc                                  AS arc_code,
+          AVG(r.total_savings)                        AS average_savings,
+          -- implemented OR blank rows only:
+          SUM(r.imp_cost) FILTER (WHERE r.imp_status='I' OR r.imp_status IS NULL
+                                     OR r.imp_status='' OR r.imp_status='N') * 1.0
+            / SUM(1) FILTER (WHERE r.imp_status='I' OR r.imp_status IS NULL
+                                OR r.imp_status='' OR r.imp_status='N')
+                                                      AS average_cost,
+          CAST(
+              AVG(CAST((COALESCE(r.imp_cost,0)*1.0/r.p_saved)*10 AS INTEGER)/10.0)
+                  FILTER (WHERE r.p_saved > 0) * 10
+              AS INTEGER
+          ) / 10.0                                    AS average_payback,
+          SUM(1) FILTER (WHERE r.imp_status='I') * 100.0
+            / SUM(1) FILTER (WHERE r.imp_status IN ('I','N'))
+                                                      AS implementation_rate,
+          COUNT(*)                                    AS times_recommended
         FROM   recommendations r
         JOIN   assessments     a ON r.assessment_id = a.id
         {where_sql}
@@ -437,62 +565,118 @@ def get_aggregates_by_arc():
         ORDER BY r.arc;
         """
 
-        conn  = sqlite3.connect(ITAC_DB)
-        conn.row_factory = sqlite3.Row
-        rows  = conn.execute(query, params).fetchall()
-        conn.close()
-
-        with open(ARC_DB) as f:
-            arc_data = json.load(f)
-
-        payload = []
-        for r in rows:
-            code = r["arc_code"]
-            payload.append({
-              "arc":               code,
-              "description":       get_arc_description(code, arc_data),
-              "avgSavings":        _currency(_safe(r["average_savings"],  0)),
-              "avgCost":           _currency(_safe(r["average_cost"],      0)),
-              "avgPayback":        round(_safe(r["average_payback"], 2), 2),
-              "implementationRate":_percent(_safe(r["implementation_rate"], 1)),
-              "recommended":       r["times_recommended"]
-            })
-
-        return jsonify({"success": True, "data": payload}), 200
+@lru_cache(maxsize=256)
+def _aggregates_response(center, state, fy_param, arc_code, stamp):
+    """Serialized (body, status) for one /aggregates parameter combination."""
+    where, params = [], []
+    if center:
+        where.append("a.center = ?");   params.append(center)
+    if state:
+        where.append("a.state  = ?");   params.append(state)
+
+    # ── FIX: filter on recommendation year (r.fiscal_year), not a.fiscal_year ──
+    if fy_param:
+        m = _FY_RE.match(fy_param)
+        if not m:
+            return _json_bytes({
+                "success": False,
+                "error": "Bad fiscal_year (ex: =2023 | >=2020 | <=2018)"
+            }), 400
+
+        op, yr = m.group(1) or "=", int(m.group(2))
+        where.append(f"r.fiscal_year {op} ?")
+        params.append(yr)
+
+    # prefix‐match ARC codes as before
+    if arc_code:
+        arc_code = arc_code.strip()
+        where.append("r.arc LIKE ?")
+        params.append(f"{arc_code}%")
+
+    query = _aggregate_sql(tuple(where))
+
+    conn = _conn()
+    cur  = conn.cursor()
+    cur.row_factory = None
+    rows = cur.execute(query, params).fetchall()
+
+    # Format in one comprehension with the description map hoisted out:
+    # no per-row helper-function chains or Row name lookups
+    arc_codes_map = _arc_codes()
+    payload = [
+        {
+          "arc":               code,
+          "description":       arc_codes_map.get(str(code), "ARC description not found") if code else "Unknown",
+          "avgSavings":        f"${(savings if savings is not None else 0):,.0f}",
+          "avgCost":           f"${(cost if cost is not None else 0):,.0f}",
+          "avgPayback":        round(payback, 2) if payback is not None else 0,
+          "implementationRate":f"{(rate if rate is not None else 0):.1f}%",
+          "recommended":       recommended
+        }
+        for code, savings, cost, payback, rate, recommended in rows
+    ]
+
+    return _json_bytes({"success": True, "data": payload}), 200
+
+@app.route("/aggregates", methods=["GET"])
+def get_aggregates_by_arc():
+    try:
+        body, status = _aggregates_response(
+            request.args.get("center"),
+            request.args.get("state"),
+            request.args.get("fiscal_year"),
+            request.args.get("arc"),
+            _db_stamp()
+        )
+        return Response(body, status=status, mimetype='application/json')
 
     except Exception as e:
-        return jsonify({
+        return _ojson({
           "success": False,
           "error": str(e),
           "trace": traceback.format_exc()
-        }), 500
+        }, 500)
 
 
-@app.route("/filter-options", methods=["GET"])
-def get_filter_options():
-    try:
-        conn = sqlite3.connect(ITAC_DB)
-        cur  = conn.cursor()
+@lru_cache(maxsize=8)
+def _filter_options_response(stamp):
+    conn = _conn()
+    cur  = conn.cursor()
+    cur.row_factory = None
 
-        cur.execute("SELECT DISTINCT center       FROM assessments WHERE center IS NOT NULL")
-        centers = sorted(row[0] for row in cur.fetchall())
+    # One table scan instead of three SELECT DISTINCTs
+    cur.execute("SELECT center, state, fiscal_year FROM assessments")
 
-        cur.execute("SELECT DISTINCT state        FROM assessments WHERE state  IS NOT NULL")
-        states  = sorted(row[0] for row in cur.fetchall())
+    center_set, state_set, year_set = set(), set(), set()
+    for center, state, year in cur:
+        center_set.add(center)
+        state_set.add(state)
+        year_set.add(year)
 
-        cur.execute("SELECT DISTINCT fiscal_year  FROM assessments WHERE fiscal_year IS NOT NULL")
-        years   = sorted((row[0] for row in cur.fetchall()), reverse=True)
+    centers = sorted(c for c in center_set if c is not None)
+    states  = sorted(s for s in state_set if s is not None)
+    years   = sorted((y for y in year_set if y is not None), reverse=True)
 
-        conn.close()
-        return jsonify({
-            "success": True,
-            "centers": centers,
-            "states":  states,
-            "years":   years
-        }), 200
+    return _json_bytes({
+        "success": True,
+        "centers": centers,
+        "states":  states,
+        "years":   years
+    })
+
+@app.route("/filter-options", methods=["GET"])
+def get_filter_options():
+    try:
+        return Response(_filter_options_response(_db_stamp()), mimetype='application/json'), 200
 
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+        return _ojson({"success": False, "error": str(e)}, 500)
 
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    # waitress is a proper threaded WSGI server; the Werkzeug dev server is
+    # single-threaded and chokes on the large JSON responses
+    try:
+        from waitress import serve
+        serve(app, host='0.0.0.0', port=5000, threads=8)
+    except ImportError:
+        app.run(debug=True)
\ No newline at end of file
@@ -32,14 +32,88 @@ TODO in convert_to_database:
 
 
 import os
+import glob
 import sqlite3
 import numpy as np
 import pandas as pd
 from config import Config
 from datetime import datetime
+from functools import partial
+from operator import contains
 from parse_xls import parse_xls
 from naics_parser import NAICSParser
 
+# Numba is an optional JIT: when installed the fused row-wise totals
+# kernels below compile to parallel machine code; without it the same
+# totals come from NumPy row sums, which beat interpreted element loops
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+if njit is not None:
+    # reassoc/contract let LLVM vectorize the inner sums without full
+    # fastmath's nnan/ninf assumptions: NaN electricity/p_conserved
+    # readings must still propagate into the computed totals
+    _jit = njit(parallel=True, fastmath={'reassoc', 'contract'}, cache=True)
+
+    @_jit
+    def _assess_totals(cost_mat, usage_mat, elec_usage):
+        """Fused ASSESS totals: cost row sums, the kWh->MMBtu electricity
+        conversion, and usage row sums plus converted electricity, all in one
+        parallel pass over the rows."""
+        n = cost_mat.shape[0]
+        total_cost = np.empty(n, np.float64)
+        elec_mmbtu = np.empty(n, np.float64)
+        total_usage = np.empty(n, np.float64)
+        for i in prange(n):
+            acc = 0.0
+            for j in range(cost_mat.shape[1]):
+                acc += cost_mat[i, j]
+            total_cost[i] = acc
+            e = elec_usage[i] * 3412.0 / 1000000.0
+            elec_mmbtu[i] = e
+            acc = e
+            for j in range(usage_mat.shape[1]):
+                acc += usage_mat[i, j]
+            total_usage[i] = acc
+        return total_cost, elec_mmbtu, total_usage
+
+    @_jit
+    def _recc_totals(savings_mat, p_conserved, conserved_mat):
+        """Fused RECC totals: savings row sums, the kWh->MMBtu primary-conserved
+        conversion, and total energy saved (primary plus secondary/tertiary),
+        all in one parallel pass over the rows."""
+        n = savings_mat.shape[0]
+        total_savings = np.empty(n, np.float64)
+        p_mmbtu = np.empty(n, np.float64)
+        total_saved = np.empty(n, np.float64)
+        for i in prange(n):
+            acc = 0.0
+            for j in range(savings_mat.shape[1]):
+                acc += savings_mat[i, j]
+            total_savings[i] = acc
+            p = p_conserved[i] * 3412.0 / 1000000.0
+            p_mmbtu[i] = p
+            acc = p
+            for j in range(conserved_mat.shape[1]):
+                acc += conserved_mat[i, j]
+            total_saved[i] = acc
+        return total_savings, p_mmbtu, total_saved
+else:
+    def _assess_totals(cost_mat, usage_mat, elec_usage):
+        """NumPy fallback for the fused ASSESS totals kernel."""
+        elec_mmbtu = elec_usage * 3412.0 / 1000000.0
+        return (cost_mat.sum(axis=1), elec_mmbtu,
+                elec_mmbtu + usage_mat.sum(axis=1))
+
+    def _recc_totals(savings_mat, p_conserved, conserved_mat):
+        """NumPy fallback for the fused RECC totals kernel."""
+        p_mmbtu = p_conserved * 3412.0 / 1000000.0
+        return (savings_mat.sum(axis=1), p_mmbtu,
+                p_mmbtu + conserved_mat.sum(axis=1))
+
 
 class IACDatabaseParser:
     """
@@ -50,8 +124,99 @@ class IACDatabaseParser:
     """
     
     # Define constants for easier maintenance
+    SCHEMA_VERSION = 1  # stamped into PRAGMA user_version to guard the DDL
     REC_RANGE = range(1, 4)  # RECC1 through RECCX tabs
+
+    # Low-cardinality string columns kept as pandas Categorical in memory
+    # (a handful of status/source/state codes repeated across every row)
+    CATEGORICAL_COLUMNS = (
+        'state', 'imp_status', 'p_source_code', 's_source_code',
+        't_source_code', 'q_source_code', 'rebate', 'incremental', 'bp_tool'
+    )
     RECOMMENDATION_TAG = 'UC'  # UConn identifier
+
+    # Only these sheets are ever read; the rest of the workbook (e.g. the
+    # Terms sheet) is never converted to a DataFrame
+    REQUIRED_SHEETS = ('ASSESS',) + tuple(f'RECC{i}' for i in REC_RANGE)
+
+    # Source column -> database column mappings. Applied at load time so
+    # the sheets arrive already projected and renamed to the target schema.
+    ASSESSMENT_COLUMNS = {
+        'ID': 'id',
+        'CENTER': 'center',
+        'FY': 'fiscal_year',
+        'SIC': 'sic',
+        'NAICS': 'naics',
+        'STATE': 'state',
+        'SALES': 'sales',
+        'EMPLOYEES': 'employees',
+        'PLANT_AREA': 'plant_area',
+        'PRODUCTS': 'products',
+        'PRODUNITS': 'prod_units',
+        'PRODLEVEL': 'prod_level',
+        'PRODHOURS': 'prod_hours',
+        'NUMARS': 'num_recommendations',
+        'EC_plant_cost': 'electricity_cost',
+        'EC_plant_usage': 'electricity_usage',
+        'ED_plant_cost': 'electricity_demand_cost',
+        'ED_plant_usage': 'electricity_demand_usage',
+        'EF_plant_cost': 'electricity_fees',
+        'E2_plant_cost': 'natural_gas_cost',
+        'E2_plant_usage': 'natural_gas_usage',
+        'E3_plant_cost': 'lpg_cost',
+        'E3_plant_usage': 'lpg_usage',
+        'E4_plant_cost': 'fuel_oil1_cost',
+        'E4_plant_usage': 'fuel_oil1_usage',
+        'E5_plant_cost': 'fuel_oil2_cost',
+        'E5_plant_usage': 'fuel_oil2_usage',
+        'E6_plant_cost': 'fuel_oil4_cost',
+        'E6_plant_usage': 'fuel_oil4_usage',
+        'E7_plant_cost': 'fuel_oil6_cost',
+        'E7_plant_usage': 'fuel_oil6_usage',
+        'E8_plant_cost': 'coal_cost',
+        'E8_plant_usage': 'coal_usage',
+        'E9_plant_cost': 'wood_cost',
+        'E9_plant_usage': 'wood_usage',
+        'E10_plant_cost': 'paper_cost',
+        'E10_plant_usage': 'paper_usage',
+        'E11_plant_cost': 'other_gas_cost',
+        'E11_plant_usage': 'other_gas_usage',
+        'E12_plant_cost': 'other_energy_cost',
+        'E12_plant_usage': 'other_energy_usage'
+    }
+
+    RECOMMENDATION_COLUMNS = {
+        'SUPERID': 'super_id',
+        'ID': 'assessment_id',
+        'AR_NUMBER': 'rec_number',
+        'APPCODE': 'app_code',
+        'ARC2': 'arc',
+        'IMPSTATUS': 'imp_status',
+        'IMPCOST': 'imp_cost',
+        'PSOURCCODE': 'p_source_code',
+        'PCONSERVED': 'p_conserved',
+        'PSOURCONSV': 'p_source_conserved',
+        'PSAVED': 'p_saved',
+        'SSOURCCODE': 's_source_code',
+        'SCONSERVED': 's_conserved',
+        'SSOURCONSV': 's_source_conserved',
+        'SSAVED': 's_saved',
+        'TSOURCCODE': 't_source_code',
+        'TCONSERVED': 't_conserved',
+        'TSOURCONSV': 't_source_conserved',
+        'TSAVED': 't_saved',
+        'QSOURCCODE': 'q_source_code',
+        'QCONSERVED': 'q_conserved',
+        'QSOURCONSV': 'q_source_conserved',
+        'QSAVED': 'q_saved',
+        'REBATE': 'rebate',
+        'INCREMNTAL': 'incremental',
+        'FY': 'fiscal_year',
+        'IC_CAPITAL': 'ic_capital',
+        'IC_OTHER': 'ic_other',
+        'PAYBACK': 'payback',
+        'BPTOOL': 'bp_tool'
+    }
     
     # Classification of recommendation implementation status
     STATUS_CODES = {
@@ -84,23 +249,86 @@ class IACDatabaseParser:
         self.database_path = Config.ITAC_DATABASE_PATH
         self.database_items = None
         self.uconn_recommendations = None
+        self.uconn_assessments = None
         self.uconn_naics_mapping = NAICSParser()
     
+    def _cache_path(self, sheet):
+        """
+        Build the parquet cache path for one sheet of the IAC workbook.
+
+        The cache name is keyed by the source file's mtime and size, so any
+        change to the workbook automatically invalidates the cache.
+        """
+        stat = os.stat(self.database_path)
+        return self.database_path + f'.{stat.st_mtime_ns}.{stat.st_size}.{sheet}.parquet'
+
     def load_database(self):
         """
         Load the complete IAC database from the specified path.
-        
+
         Returns:
             dict: A dictionary containing DataFrames for each sheet in the IAC Database.
-        
+
         Raises:
             FileNotFoundError: If the database file cannot be found.
         """
-        self.database_items = parse_xls(self.database_path)
-        
+        # Fast path: the legacy .xls parse is the dominant cost, so each
+        # projected + renamed sheet is cached to a parquet sidecar next to
+        # the workbook (same scheme as the ARC parser's cache)
+        try:
+            cached = {sheet: pd.read_parquet(self._cache_path(sheet))
+                      for sheet in self.REQUIRED_SHEETS
+                      if os.path.exists(self._cache_path(sheet))}
+        except Exception as e:
+            print(f"Warning: could not read IAC parquet cache: {e}")
+            cached = {}
+        if len(cached) == len(self.REQUIRED_SHEETS):
+            self.database_items = cached
+            return self.database_items
+
+        # Project unwanted columns away at parse time, then rename straight
+        # into the target schema so later stages never touch source names.
+        # partial(contains, ...) is the picklable spelling of the membership
+        # lambda, so the filters survive the trip to parse_xls's sheet workers
+        usecols = {'ASSESS': partial(contains, frozenset(self.ASSESSMENT_COLUMNS))}
+        recc_filter = partial(contains, frozenset(self.RECOMMENDATION_COLUMNS))
+        for i in self.REC_RANGE:
+            usecols[f'RECC{i}'] = recc_filter
+
+        self.database_items = parse_xls(self.database_path,
+                                        sheet_names=self.REQUIRED_SHEETS,
+                                        usecols=usecols)
+
         if self.database_items is None:
             raise FileNotFoundError(f"Could not find the IAC database file at {self.database_path}")
-        
+
+        for sheet, mapping in [('ASSESS', self.ASSESSMENT_COLUMNS)] + \
+                              [(f'RECC{i}', self.RECOMMENDATION_COLUMNS) for i in self.REC_RANGE]:
+            df = self.database_items[sheet].rename(columns=mapping)
+            # Keep the mapping's column order, matching the old post-load filter
+            df = df[[c for c in mapping.values() if c in df.columns]]
+            # Dictionary-encode the tiny-cardinality string columns: one code
+            # per distinct value instead of a duplicate Python string per row,
+            # both in memory and in the parquet cache
+            for col in self.CATEGORICAL_COLUMNS:
+                if col in df.columns:
+                    df[col] = df[col].astype('category')
+            # Integer columns hold years and small counts; int32 halves
+            # their memory (and parquet) footprint with no loss
+            for col in df.columns:
+                if df[col].dtype == np.int64:
+                    df[col] = df[col].astype(np.int32)
+            self.database_items[sheet] = df
+
+        # Refresh the cache: drop stale sidecars, then write the new ones
+        for stale in glob.glob(self.database_path + '.*.parquet'):
+            os.remove(stale)
+        try:
+            for sheet, df in self.database_items.items():
+                df.to_parquet(self._cache_path(sheet))
+        except Exception as e:
+            print(f"Warning: could not write IAC parquet cache: {e}")
+
         return self.database_items
     
     def load_uconn_recommendations(self):
@@ -116,14 +344,27 @@ class IACDatabaseParser:
         if self.database_items is None:
             self.load_database()
         
-        # Extract all recommendation dataframes
-        recc_dfs = [pd.DataFrame(self.database_items[f'RECC{i}']) for i in self.REC_RANGE]
-        
+        # The parsed sheets are already DataFrames; re-wrapping them in
+        # pd.DataFrame(...) would copy every block
+        recc_dfs = [self.database_items[f'RECC{i}'] for i in self.REC_RANGE]
+
         # Filter for UConn recommendations
         # uconn_recc_dfs = [df[df['SUPERID'].str.startswith(self.RECOMMENDATION_TAG)] for df in recc_dfs]
-        
-        # Combine all UConn recommendation dataframes
-        self.uconn_recommendations = pd.concat(recc_dfs, ignore_index=True)
+
+        # Combine the recommendation dataframes column-wise: one final-size
+        # allocation per column, skipping pd.concat's intermediate block
+        # materialization and BlockManager rebuild (the sheets share a schema
+        # after load-time projection). Categorical columns are unioned so the
+        # dictionary encoding survives the combine
+        def combine(col):
+            parts = [df[col] for df in recc_dfs]
+            if isinstance(parts[0].dtype, pd.CategoricalDtype):
+                return pd.api.types.union_categoricals(parts)
+            return np.concatenate([part.to_numpy() for part in parts])
+
+        self.uconn_recommendations = pd.DataFrame({
+            col: combine(col) for col in recc_dfs[0].columns
+        })
         
         return self.uconn_recommendations
     
@@ -142,15 +383,40 @@ class IACDatabaseParser:
         if self.database_items is None:
             self.load_database()
         
-        # Extract assessment dataframes
-        assess_dfs = pd.DataFrame(self.database_items[f'ASSESS'])
+        # Extract the assessment dataframe (no copying re-wrap)
+        assess_dfs = self.database_items['ASSESS']
 
         # Filter for UConn assessments
         # uconn_assess_dfs = assess_dfs[assess_dfs['CENTER'].str.startswith(self.RECOMMENDATION_TAG)]
 
-        return assess_dfs
+        self.uconn_assessments = assess_dfs
+        return self.uconn_assessments
     
 
+    @staticmethod
+    def _insert_dataframe(conn, table, df):
+        """Replace a table's contents with a DataFrame via executemany.
+
+        Drop-in for DataFrame.to_sql(..., if_exists='replace') without the
+        pandas sqlite shim: one prepared INSERT, one transaction. Column
+        affinities mirror what pandas would have declared.
+        """
+        dtype_sql = {'f': 'REAL', 'i': 'INTEGER', 'u': 'INTEGER', 'b': 'INTEGER'}
+        columns_sql = ', '.join(
+            f'"{col}" {dtype_sql.get(df[col].dtype.kind, "TEXT")}' for col in df.columns
+        )
+        conn.execute(f'DROP TABLE IF EXISTS {table}')
+        conn.execute(f'CREATE TABLE {table} ({columns_sql})')
+
+        # Bind from the frame's records in 10k-row batches: each executemany
+        # gets a plain list of tuples (no per-row pandas itertuples overhead)
+        # while the batch size keeps the bound-parameter working set small
+        placeholders = ', '.join('?' * len(df.columns))
+        insert_sql = f'INSERT INTO {table} VALUES ({placeholders})'
+        records = df.to_records(index=False)
+        for start in range(0, len(records), 10_000):
+            conn.executemany(insert_sql, records[start:start + 10_000].tolist())
+
     def convert_to_database(self, df=None, output_db_path=None):
         """
         Convert IAC database data to SQL database format.
@@ -171,7 +437,7 @@ class IACDatabaseParser:
 
         # Set default output path if not specified
         if output_db_path is None:
-            output_db_path = getattr(Config, 'ITAC_DATABASE_SQL_PATH')
+            output_db_path = Config.ITAC_DATABASE_SQL_PATH
         
         # Create the directory if it doesn't exist
         os.makedirs(os.path.dirname(output_db_path), exist_ok=True)
@@ -180,12 +446,24 @@ class IACDatabaseParser:
         if self.database_items is None:
             self.load_database()
         
-        # Create database connection
-        conn = sqlite3.connect(output_db_path)
+        # Build the database entirely in memory and serialize it to disk in
+        # one sequential VACUUM INTO write at the end, instead of paying
+        # per-transaction writes against the target file.
+        conn = sqlite3.connect(':memory:')
         cursor = conn.cursor()
-        
-        # Create tables (schema definition)
-        cursor.executescript('''
+        cursor.executescript(
+            "PRAGMA synchronous=OFF;"
+            "PRAGMA journal_mode=MEMORY;"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA cache_size=-200000;"
+        )
+
+        # Create tables (schema definition), but only when this database has
+        # not been stamped with the current schema version yet. A fresh
+        # in-memory build always needs it; the guard makes reconversion into
+        # an existing file skip the DDL parse and index/table rebuilds.
+        if cursor.execute('PRAGMA user_version').fetchone()[0] < self.SCHEMA_VERSION:
+            cursor.executescript('''
         -- Assessments table (from ASSESS tab)
         CREATE TABLE IF NOT EXISTS assessments (
             id VARCHAR(20) PRIMARY KEY,
@@ -234,10 +512,14 @@ class IACDatabaseParser:
             
             -- Total energy metrics (computed)
             total_energy_cost DECIMAL(20,2),
-            total_energy_usage DECIMAL(20,2),
-            
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            total_energy_usage DECIMAL(20,2)
+        );
+
+        -- Load metadata: one timestamp for the whole batch instead of
+        -- per-row created_at/updated_at columns on every assessment
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
         );
 
         -- Recommendations table (from RECC tabs)
@@ -295,64 +577,22 @@ class IACDatabaseParser:
             description VARCHAR(100),
             unit VARCHAR(20),
             energy_type VARCHAR(30),
-            conversion_factor DECIMAL(20,6)
+            conversion_factor REAL
         );
-        ''')
-        
-        # Process and insert assessments data
-        assessments_df = self.load_uconn_assessments()
-        
-        # Clean and transform assessments data
-        assessment_columns = {
-            'ID': 'id',
-            'CENTER': 'center',
-            'FY': 'fiscal_year',
-            'SIC': 'sic',
-            'NAICS': 'naics',
-            'STATE': 'state',
-            'SALES': 'sales',
-            'EMPLOYEES': 'employees',
-            'PLANT_AREA': 'plant_area',
-            'PRODUCTS': 'products',
-            'PRODUNITS': 'prod_units',
-            'PRODLEVEL': 'prod_level',
-            'PRODHOURS': 'prod_hours',
-            'NUMARS': 'num_recommendations',
-            'EC_plant_cost': 'electricity_cost',
-            'EC_plant_usage': 'electricity_usage',
-            'ED_plant_cost': 'electricity_demand_cost',
-            'ED_plant_usage': 'electricity_demand_usage',
-            'EF_plant_cost': 'electricity_fees',
-            'E2_plant_cost': 'natural_gas_cost',
-            'E2_plant_usage': 'natural_gas_usage',
-            'E3_plant_cost': 'lpg_cost',
-            'E3_plant_usage': 'lpg_usage',
-            'E4_plant_cost': 'fuel_oil1_cost',
-            'E4_plant_usage': 'fuel_oil1_usage',
-            'E5_plant_cost': 'fuel_oil2_cost',
-            'E5_plant_usage': 'fuel_oil2_usage',
-            'E6_plant_cost': 'fuel_oil4_cost',
-            'E6_plant_usage': 'fuel_oil4_usage',
-            'E7_plant_cost': 'fuel_oil6_cost',
-            'E7_plant_usage': 'fuel_oil6_usage',
-            'E8_plant_cost': 'coal_cost',
-            'E8_plant_usage': 'coal_usage',
-            'E9_plant_cost': 'wood_cost',
-            'E9_plant_usage': 'wood_usage',
-            'E10_plant_cost': 'paper_cost',
-            'E10_plant_usage': 'paper_usage',
-            'E11_plant_cost': 'other_gas_cost',
-            'E11_plant_usage': 'other_gas_usage',
-            'E12_plant_cost': 'other_energy_cost',
-            'E12_plant_usage': 'other_energy_usage'
-        }
-        
-        # Rename columns 
-        clean_assess_df = assessments_df.rename(columns=assessment_columns)
-        
-        # Filter for relevant columns
-        clean_assess_df = clean_assess_df[[col for col in assessment_columns.values() if col in clean_assess_df.columns]]
-        
+            ''')
+            cursor.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+
+        # Stamp the batch load time once for the whole conversion
+        cursor.execute("INSERT OR REPLACE INTO meta VALUES ('loaded_at', ?)",
+                       (datetime.now().isoformat(),))
+
+        # Process and insert assessments data (already projected and renamed
+        # to the target schema at load time, and cached across calls the same
+        # way as the recommendations frame)
+        if self.uconn_assessments is None:
+            self.load_uconn_assessments()
+        clean_assess_df = self.uconn_assessments
+
         # Add computed columns
         # Calculate total energy cost
         energy_cost_cols = [
@@ -361,114 +601,84 @@ class IACDatabaseParser:
             'fuel_oil1_cost', 'fuel_oil2_cost', 'fuel_oil4_cost', 'fuel_oil6_cost',
             'coal_cost', 'wood_cost', 'paper_cost', 'other_gas_cost', 'other_energy_cost'
         ]
-        clean_assess_df['total_energy_cost'] = clean_assess_df[
-            [col for col in energy_cost_cols if col in clean_assess_df.columns]
-        ].sum(axis=1, skipna=True)
-        
+        present_cost_cols = [col for col in energy_cost_cols if col in clean_assess_df.columns]
+
         # Calculate total energy usage (all in MMBtu)
         # Convert electricity from kWh to MMBtu (3412 BTU/kWh)
-        if 'electricity_usage' in clean_assess_df.columns:
-            clean_assess_df['electricity_usage_mmbtu'] = clean_assess_df['electricity_usage'] * 3412 / 1000000
-        else:
-            clean_assess_df['electricity_usage_mmbtu'] = 0
-        
-        # Sum all energy usage
         energy_usage_cols = [
-            'natural_gas_usage', 'lpg_usage', 
+            'natural_gas_usage', 'lpg_usage',
             'fuel_oil1_usage', 'fuel_oil2_usage', 'fuel_oil4_usage', 'fuel_oil6_usage',
             'coal_usage', 'wood_usage', 'paper_usage', 'other_gas_usage', 'other_energy_usage'
         ]
+        present_usage_cols = [col for col in energy_usage_cols if col in clean_assess_df.columns]
 
-        clean_assess_df['total_energy_usage'] = clean_assess_df['electricity_usage_mmbtu'] + clean_assess_df[
-            [col for col in energy_usage_cols if col in clean_assess_df.columns]
-        ].sum(axis=1, skipna=True)
-        
-        # Clean up data types
+        # One fused pass over contiguous arrays (JIT-compiled in parallel when
+        # numba is available) instead of the pandas per-block NaN-aware
+        # reducers; NaNs in the summed matrices become 0, same as skipna,
+        # while NaN electricity readings still propagate into the totals
+        if 'electricity_usage' in clean_assess_df.columns:
+            elec_usage = clean_assess_df['electricity_usage'].to_numpy(dtype=np.float64)
+        else:
+            elec_usage = np.zeros(len(clean_assess_df))
+        total_cost, elec_mmbtu, total_usage = _assess_totals(
+            clean_assess_df[present_cost_cols].to_numpy(dtype=np.float64, na_value=0.0),
+            clean_assess_df[present_usage_cols].to_numpy(dtype=np.float64, na_value=0.0),
+            elec_usage,
+        )
+        clean_assess_df['total_energy_cost'] = total_cost
+        clean_assess_df['electricity_usage_mmbtu'] = elec_mmbtu
+        clean_assess_df['total_energy_usage'] = total_usage
+        
+        # Clean up data types in one shot: a single block assignment instead
+        # of one BlockManager rewrite per column
         numeric_cols = [col for col in clean_assess_df.columns if col not in ['id', 'center', 'sic', 'naics', 'state', 'products', 'prod_units']]
-        for col in numeric_cols:
-            clean_assess_df[col] = pd.to_numeric(clean_assess_df[col], errors='coerce')
+        clean_assess_df[numeric_cols] = clean_assess_df[numeric_cols].apply(pd.to_numeric, errors='coerce')
         
         # Insert assessments data
-        clean_assess_df.to_sql('assessments', conn, if_exists='replace', index=False)
+        self._insert_dataframe(conn, 'assessments', clean_assess_df)
         
         # Process and insert recommendations data
         if self.uconn_recommendations is None:
             self.load_uconn_recommendations()
         
-        recommendations_df = self.uconn_recommendations
-        
-        # Clean and transform recommendations data
-        recommendation_columns = {
-            'SUPERID': 'super_id',
-            'ID': 'assessment_id',
-            'AR_NUMBER': 'rec_number',
-            'APPCODE': 'app_code',
-            'ARC2': 'arc',
-            'IMPSTATUS': 'imp_status',
-            'IMPCOST': 'imp_cost',
-            'PSOURCCODE': 'p_source_code',
-            'PCONSERVED': 'p_conserved',
-            'PSOURCONSV': 'p_source_conserved',
-            'PSAVED': 'p_saved',
-            'SSOURCCODE': 's_source_code',
-            'SCONSERVED': 's_conserved',
-            'SSOURCONSV': 's_source_conserved',
-            'SSAVED': 's_saved',
-            'TSOURCCODE': 't_source_code',
-            'TCONSERVED': 't_conserved',
-            'TSOURCONSV': 't_source_conserved',
-            'TSAVED': 't_saved',
-            'QSOURCCODE': 'q_source_code',
-            'QCONSERVED': 'q_conserved',
-            'QSOURCONSV': 'q_source_conserved',
-            'QSAVED': 'q_saved',
-            'REBATE': 'rebate',
-            'INCREMNTAL': 'incremental',
-            'FY': 'fiscal_year',
-            'IC_CAPITAL': 'ic_capital',
-            'IC_OTHER': 'ic_other',
-            'PAYBACK': 'payback',
-            'BPTOOL': 'bp_tool'
-        }
-        
-        # Rename columns
-        clean_recc_df = recommendations_df.rename(columns=recommendation_columns)
-        
-        # Filter for relevant columns
-        clean_recc_df = clean_recc_df[[col for col in recommendation_columns.values() if col in clean_recc_df.columns]]
-        
+        # Already projected and renamed to the target schema at load time
+        clean_recc_df = self.uconn_recommendations
+
         # Add computed columns
         # Calculate total savings across all resources
         savings_cols = ['p_saved', 's_saved', 't_saved', 'q_saved']
-        clean_recc_df['total_savings'] = clean_recc_df[
-            [col for col in savings_cols if col in clean_recc_df.columns]
-        ].sum(axis=1, skipna=True)
-        
-        # Calculate total energy saved in MMBtu
-        # Convert primary (electricity) from kWh to MMBtu
+        present_savings_cols = [col for col in savings_cols if col in clean_recc_df.columns]
+
+        # Calculate total energy saved in MMBtu, fused with the savings sums
+        # into one pass over contiguous arrays (JIT-compiled in parallel when
+        # numba is available) instead of a Series per step.
+        # Convert primary (electricity) from kWh to MMBtu; NaN electricity
+        # keeps the old NaN-propagating behavior in both columns, while the
+        # secondary/tertiary savings (already in MMBtu) treat NaN as 0
         if 'p_conserved' in clean_recc_df.columns:
-            clean_recc_df['p_conserved_mmbtu'] = clean_recc_df['p_conserved'] * 3412 / 1000000
+            p_conserved = clean_recc_df['p_conserved'].to_numpy(dtype=np.float64)
         else:
-            clean_recc_df['p_conserved_mmbtu'] = 0
-        
-        clean_recc_df['total_energy_saved'] = clean_recc_df['p_conserved_mmbtu']
-        
-        # Add secondary and tertiary resource savings (already in MMBtu)
-        for col in ['s_conserved', 't_conserved']:
-            if col in clean_recc_df.columns:
-                clean_recc_df['total_energy_saved'] += clean_recc_df[col].fillna(0)
+            p_conserved = np.zeros(len(clean_recc_df))
+        present_conserved_cols = [col for col in ['s_conserved', 't_conserved'] if col in clean_recc_df.columns]
+        total_savings, p_conserved_mmbtu, total_energy_saved = _recc_totals(
+            clean_recc_df[present_savings_cols].to_numpy(dtype=np.float64, na_value=0.0),
+            p_conserved,
+            clean_recc_df[present_conserved_cols].to_numpy(dtype=np.float64, na_value=0.0),
+        )
+        clean_recc_df['total_savings'] = total_savings
+        clean_recc_df['p_conserved_mmbtu'] = p_conserved_mmbtu
+        clean_recc_df['total_energy_saved'] = total_energy_saved
         
         # Clean up data types
         numeric_cols = [col for col in clean_recc_df.columns if col not in [
-            'super_id', 'assessment_id', 'app_code', 'arc', 'imp_status', 
+            'super_id', 'assessment_id', 'app_code', 'arc', 'imp_status',
             'p_source_code', 's_source_code', 't_source_code', 'q_source_code',
             'rebate', 'incremental', 'bp_tool'
         ]]
-        for col in numeric_cols:
-            clean_recc_df[col] = pd.to_numeric(clean_recc_df[col], errors='coerce')
+        clean_recc_df[numeric_cols] = clean_recc_df[numeric_cols].apply(pd.to_numeric, errors='coerce')
         
         # Insert recommendations data
-        clean_recc_df.to_sql('recommendations', conn, if_exists='replace', index=False)
+        self._insert_dataframe(conn, 'recommendations', clean_recc_df)
         
         # Create resource codes reference data
         resource_codes_data = [
@@ -488,15 +698,32 @@ class IACDatabaseParser:
             ('21', 'Water', 'kGal', 'Water', 0.0)
         ]
         
-        # Insert resource codes
-        resource_codes_df = pd.DataFrame(resource_codes_data, 
-                                    columns=['code', 'description', 'unit', 'energy_type', 'conversion_factor'])
-        resource_codes_df.to_sql('resource_codes', conn, if_exists='replace', index=False)
-    
-        # Create views for dashboard queries
+        # Insert resource codes straight into the DDL table: 14 constant rows
+        # do not need a DataFrame round-trip
+        cursor.execute('DELETE FROM resource_codes')
+        cursor.executemany(
+            'INSERT INTO resource_codes(code, description, unit, energy_type, conversion_factor) '
+            'VALUES (?, ?, ?, ?, ?)',
+            resource_codes_data
+        )
+
+        # Index the join/grouping columns the dashboard views lean on, so
+        # view-backed queries seek instead of nested-loop scanning; built
+        # after the bulk loads to keep the inserts index-maintenance free
         cursor.executescript('''
-        -- View for recommendation summary stats
-        CREATE VIEW IF NOT EXISTS recommendation_stats AS
+        CREATE INDEX IF NOT EXISTS idx_rec_aid ON recommendations(assessment_id);
+        CREATE INDEX IF NOT EXISTS idx_rec_arc_status ON recommendations(arc, imp_status);
+        CREATE INDEX IF NOT EXISTS idx_assess_fy_state ON assessments(fiscal_year, state, naics);
+        ANALYZE;
+        ''')
+
+        # Materialized summary tables for dashboard queries: the join and
+        # group-by run once here, so dashboard reads scan a small precomputed
+        # table instead of re-executing the join behind a view every time
+        cursor.executescript('''
+        -- Recommendation summary stats
+        DROP TABLE IF EXISTS recommendation_stats;
+        CREATE TABLE recommendation_stats AS
         SELECT 
             a.fiscal_year,
             a.state,
@@ -513,8 +740,9 @@ class IACDatabaseParser:
         JOIN assessments a ON r.assessment_id = a.id
         GROUP BY a.fiscal_year, a.state, a.naics, a.sic, r.arc, r.imp_status;
 
-        -- View for energy usage by assessment
-        CREATE VIEW IF NOT EXISTS energy_usage AS
+        -- Energy usage by assessment
+        DROP TABLE IF EXISTS energy_usage;
+        CREATE TABLE energy_usage AS
         SELECT
             id,
             fiscal_year,
@@ -536,8 +764,9 @@ class IACDatabaseParser:
             END as energy_cost_per_mmbtu
         FROM assessments;
         
-        -- View for resource savings by type
-        CREATE VIEW IF NOT EXISTS resource_savings AS
+        -- Resource savings by type
+        DROP TABLE IF EXISTS resource_savings;
+        CREATE TABLE resource_savings AS
         SELECT
             r.assessment_id,
             a.fiscal_year,
@@ -560,8 +789,9 @@ class IACDatabaseParser:
         JOIN assessments a ON r.assessment_id = a.id
         GROUP BY r.assessment_id, a.fiscal_year, a.state, a.naics, r.arc, r.imp_status;
         
-        -- View for implementation status summary
-        CREATE VIEW IF NOT EXISTS implementation_status AS
+        -- Implementation status summary
+        DROP TABLE IF EXISTS implementation_status;
+        CREATE TABLE implementation_status AS
         SELECT
             a.fiscal_year,
             r.imp_status,
@@ -580,24 +810,10 @@ class IACDatabaseParser:
         FROM recommendations r
         JOIN assessments a ON r.assessment_id = a.id
         GROUP BY a.fiscal_year, r.imp_status;
-        
-        -- View for ARC category summary
-        CREATE VIEW IF NOT EXISTS arc_category_summary AS
-        SELECT
-            a.fiscal_year,
-            ah.description as category,
-            ah.level,
-            COUNT(*) as rec_count,
-            SUM(CASE WHEN r.imp_status = 'I' THEN 1 ELSE 0 END) as implemented_count,
-            SUM(r.total_savings) as total_savings,
-            AVG(r.payback) as avg_payback
-        FROM recommendations r
-        JOIN assessments a ON r.assessment_id = a.id
-        JOIN arc_hierarchy ah ON r.arc = ah.arc
-        GROUP BY a.fiscal_year, ah.description, ah.level;
-        
-        -- View for best practices tool usage
-        CREATE VIEW IF NOT EXISTS best_practice_tools AS
+
+        -- Best practices tool usage
+        DROP TABLE IF EXISTS best_practice_tools;
+        CREATE TABLE best_practice_tools AS
         SELECT
             a.fiscal_year,
             r.bp_tool,
@@ -609,9 +825,39 @@ class IACDatabaseParser:
         WHERE r.bp_tool IS NOT NULL AND r.bp_tool != ''
         GROUP BY a.fiscal_year, r.bp_tool;
         ''')
-        
+
+        # The ARC category summary joins on arc_hierarchy, which this
+        # converter does not create yet (see the module TODO). Only build it
+        # once that table actually exists.
+        if cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='arc_hierarchy'"
+        ).fetchone():
+            cursor.executescript('''
+            -- ARC category summary
+            DROP TABLE IF EXISTS arc_category_summary;
+            CREATE TABLE arc_category_summary AS
+            SELECT
+                a.fiscal_year,
+                ah.description as category,
+                ah.level,
+                COUNT(*) as rec_count,
+                SUM(CASE WHEN r.imp_status = 'I' THEN 1 ELSE 0 END) as implemented_count,
+                SUM(r.total_savings) as total_savings,
+                AVG(r.payback) as avg_payback
+            FROM recommendations r
+            JOIN assessments a ON r.assessment_id = a.id
+            JOIN arc_hierarchy ah ON r.arc = ah.arc
+            GROUP BY a.fiscal_year, ah.description, ah.level;
+            ''')
+
         # Commit changes and close connection
         conn.commit()
+
+        # One sequential write of the finished page image; VACUUM INTO
+        # refuses to overwrite, so clear the previous build first
+        if os.path.exists(output_db_path):
+            os.remove(output_db_path)
+        conn.execute("VACUUM INTO ?", (output_db_path,))
         conn.close()
         
         return {
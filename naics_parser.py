@@ -5,48 +5,89 @@ Enhanced NAICS parser implementation with improved hierarchy building and range
 
 
 import os
+import re
+import pickle
+from bisect import bisect_left
 import pandas as pd
 import numpy as np
 from parse_xls import parse_xls
 from config import Config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Deletion table for code lookups: one C-level translate pass instead of a
+# chained .replace per junk character
+_CODE_JUNK = str.maketrans('', '', ', ')
 class NAICSNode:
     """
     Represents a node in the NAICS classification tree.
     Each node corresponds to an industry code and its description.
+
+    __slots__ keeps the ~2k nodes to fixed-layout attribute storage (no
+    per-instance __dict__), and children live in a plain list since lookups
+    always go through the parser's all_nodes map.
     """
+    __slots__ = ('code', 'title', 'children', 'parent', 'is_range',
+                 'alternate_codes', '_dict_cache', '_path_cache',
+                 '_children_dicts', '_pre_start', '_pre_end', '_pre_depth')
+
     def __init__(self, code, title):
         self.code = code                    # The NAICS code (as a string)
         self.title = title                  # The title/description of the industry
-        self.children = {}                  # Dictionary of child nodes, keyed by their code
+        self.children = []                  # Child nodes in insertion order
         self.parent = None                  # Reference to parent node
         self.is_range = '-' in code         # Flag for range codes (e.g., "44-45")
         self.alternate_codes = []           # Additional codes this node can be referenced by
-        
+        self._dict_cache = None             # Memoized to_dict (tree is read-only post-build)
+        self._path_cache = None             # Memoized root-to-node path
+        self._children_dicts = None         # Code-sorted child dicts, built once post-build
+        self._pre_start = 0                 # Subtree slice bounds in the parser's
+        self._pre_end = 0                   # pre-order flattening (set by _index_tree)
+        self._pre_depth = 0                 # Absolute depth below ROOT
+
     def add_child(self, child_node):
         """Add a child node to this node"""
-        self.children[child_node.code] = child_node
+        self.children.append(child_node)
         child_node.parent = self
-    
+        self._dict_cache = None             # has_children may have changed
+        child_node._path_cache = None
+
     def add_alternate_code(self, alt_code):
         """Add an alternate code for this node"""
         if alt_code not in self.alternate_codes:
             self.alternate_codes.append(alt_code)
+            self._dict_cache = None
     
     def get_path(self):
         """Returns the path from root to this node"""
-        if self.parent is None:
-            return [self]
-        return self.parent.get_path() + [self]
+        # Walk the parent chain iteratively: no recursion frames and no
+        # intermediate list per level; the result is cached since parents
+        # never change after the hierarchy is built
+        if self._path_cache is None:
+            path = []
+            node = self
+            while node is not None:
+                path.append(node)
+                node = node.parent
+            path.reverse()
+            self._path_cache = path
+        return self._path_cache
     
     def to_dict(self):
         """Convert node to dictionary format for API responses"""
-        return {
-            'code': self.code,
-            'title': self.title,
-            'is_range': self.is_range,
-            'alternate_codes': self.alternate_codes,
-            'has_children': len(self.children) > 0
-        }
+        # Memoized: every API lookup would otherwise rebuild an identical dict
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'code': self.code,
+                'title': self.title,
+                'is_range': self.is_range,
+                'alternate_codes': self.alternate_codes,
+                'has_children': len(self.children) > 0
+            }
+        return self._dict_cache
     
     def __str__(self):
         return f"{self.code}: {self.title}"
@@ -75,11 +116,66 @@ class NAICSParser:
         self.root = NAICSNode("ROOT", "North American Industry Classification System")
         self.all_nodes = {}                     # Dictionary for direct code lookups
         self.code_aliases = {}                  # Maps alternate codes to their canonical codes
-        
-        # Load and parse the data
-        self.load_naics_data()
-        self.build_hierarchy()
-    
+        self._title_lower = None                # Lowercased titles, one per data row
+        self._search_codes = None               # Codes aligned with _title_lower
+        self._token_index = {}                  # Lowercased title token -> data row postings
+        self._sorted_codes = []                 # All codes, lexicographic, for bisect windows
+        self._code_order = {}                   # Code -> insertion rank in all_nodes
+        self._preorder_nodes = []               # Every node in root pre-order
+        self._pre_depths = None                 # int32 depth per pre-order slot
+        self._resolved_nodes = {}               # code or alias -> node, one probe
+        self._int_nodes = {}                    # same, keyed by int for numeric input
+        
+        # Load and parse the data, preferring the pickled hierarchy from a
+        # previous run: a worker restart then pays one pickle read instead of
+        # re-parsing the workbook and rebuilding the whole tree
+        if not self._load_cached_hierarchy():
+            self.load_naics_data()
+            self.build_hierarchy()
+            self._save_cached_hierarchy()
+
+        # Warm the per-node caches once so API reads never pay to rebuild
+        for node in self.all_nodes.values():
+            node.to_dict()
+            node.get_path()
+
+    def _load_cached_hierarchy(self):
+        """
+        Reload a previously built hierarchy from the pickle sidecar.
+
+        Returns:
+            bool: True when a cache at least as new as the Excel source was
+                  loaded; False means the caller must build from scratch.
+        """
+        pickle_path = Config.NAICS_PICKLE_PATH
+        try:
+            if not os.path.exists(pickle_path) or \
+                    os.path.getmtime(pickle_path) < os.path.getmtime(Config.NAICS_CODES_PATH):
+                return False
+            with open(pickle_path, 'rb') as f:
+                (self.naics_data, self.root, self.all_nodes, self.code_aliases,
+                 self._title_lower, self._search_codes, self._token_index) = pickle.load(f)
+            # Derived lookup tables are cheap to recompute, so they stay out
+            # of the pickle payload
+            self._index_tree()
+            print(f"Loaded cached NAICS hierarchy with {len(self.all_nodes)} nodes")
+            return True
+        except Exception as e:
+            print("Could not load cached NAICS hierarchy, rebuilding: ", e)
+            return False
+
+    def _save_cached_hierarchy(self):
+        """Persist the built hierarchy so later startups can skip the build."""
+        try:
+            with open(Config.NAICS_PICKLE_PATH, 'wb') as f:
+                pickle.dump((self.naics_data, self.root, self.all_nodes,
+                             self.code_aliases, self._title_lower,
+                             self._search_codes, self._token_index),
+                            f, protocol=5)
+        except Exception as e:
+            # A failed cache write only costs the next startup a rebuild
+            print("Could not cache NAICS hierarchy: ", e)
+
     def load_naics_data(self):
         """
         Load NAICS data from the specified Excel file.
@@ -124,12 +220,25 @@ class NAICSParser:
         # Rename columns for consistency
         self.naics_data = self.naics_data.rename(columns={code_col: 'Code', title_col: 'Title'})
 
-        # Ensure codes are strings and clean them
-        self.naics_data['Code'] = self.naics_data['Code'].astype(str).str.strip()
+        # Ensure codes are strings and clean them once here (strip plus any
+        # stray commas/spaces), so the hierarchy build never re-normalizes
+        self.naics_data['Code'] = self.naics_data['Code'].astype(str).str.strip() \
+            .str.replace(r'[, ]', '', regex=True)
         
         # Apply fixes to the NAICS data including range code handling
         self.naics_data = self.fix_naics_classifications(self.naics_data)
-        
+
+        # Precompute the search structures once: lowercased titles plus an
+        # inverted token -> rows index, so each search intersects postings
+        # instead of regex-scanning every title
+        self._title_lower = self.naics_data['Title'].astype(str).str.lower().to_numpy()
+        self._search_codes = self.naics_data['Code'].to_numpy()
+        self._token_index = {}
+        for row, title in enumerate(self._title_lower):
+            for token in set(re.split(r'\W+', title)):
+                if token:
+                    self._token_index.setdefault(token, []).append(row)
+
         return self.naics_data
     
     def fix_naics_classifications(self, naics_data):
@@ -150,52 +259,46 @@ class NAICSParser:
 
         # Identify rows with range codes (containing a dash)
         mask_range = corrected_data['Code'].str.contains('-')
-        range_rows = corrected_data[mask_range].copy()
-        
+        range_rows = corrected_data[mask_range]
+
         # Only proceed if range codes are found
         if not range_rows.empty:
             print(f"Found {len(range_rows)} range codes to process")
-            
-            # Create a list for new rows
-            new_rows = []
-            
-            # Process each range code
-            for _, row in range_rows.iterrows():
-                code_range = row['Code']
-                title = row['Title']
-                
-                try:
-                    # Split the range and create new rows for each code
-                    code_parts = code_range.split('-')
-                    if len(code_parts) == 2 and code_parts[0].isdigit() and code_parts[1].isdigit():
-                        start_code = int(code_parts[0].strip())
-                        end_code = int(code_parts[1].strip())
-                        
-                        # Range should be reasonable (to avoid errors)
-                        if 0 < end_code - start_code < 100:
-                            for code in range(start_code, end_code + 1):
-                                new_row = row.copy()
-                                new_row['Code'] = str(code)
-                                new_row['IsPartOfRange'] = code_range  # Track origin
-                                new_rows.append(new_row)
-                            print(f"Expanded range code {code_range} into {end_code - start_code + 1} individual codes")
-                except Exception as e:
-                    print(f"Error processing range code {code_range}: {e}")
-            
+
+            # Vectorized expansion: split every range at once, keep the
+            # well-formed ones (two numeric endpoints, reasonable span), then
+            # materialize all expanded codes with repeat/arange instead of a
+            # per-row iterrows loop
+            parts = range_rows['Code'].str.split('-', expand=True)
+            starts = pd.to_numeric(parts[0].str.strip(), errors='coerce')
+            ends = pd.to_numeric(parts.get(1, default=pd.Series(index=parts.index, dtype=object)).str.strip(), errors='coerce')
+            valid = (ends - starts).between(1, 99)
+
+            starts_v = starts[valid].astype(int).to_numpy()
+            ends_v = ends[valid].astype(int).to_numpy()
+            counts = ends_v - starts_v + 1
+
+            for code_range, count in zip(range_rows.loc[valid, 'Code'], counts):
+                print(f"Expanded range code {code_range} into {count} individual codes")
+
             # Add the new rows to the DataFrame
-            if new_rows:
+            if len(starts_v):
                 # Ensure the original data has the IsPartOfRange column
                 if 'IsPartOfRange' not in corrected_data.columns:
                     corrected_data['IsPartOfRange'] = None
-                
-                # Convert new rows to DataFrame and combine with original
-                new_rows_df = pd.DataFrame(new_rows)
-                
+
+                # One array per column, then a single concat with the original
+                new_rows_df = pd.DataFrame({
+                    'Code': np.concatenate([np.arange(s, e + 1) for s, e in zip(starts_v, ends_v)]).astype(str),
+                    'Title': np.repeat(range_rows.loc[valid, 'Title'].to_numpy(), counts),
+                    'IsPartOfRange': np.repeat(range_rows.loc[valid, 'Code'].to_numpy(), counts)  # Track origin
+                })
+
                 # Keep the original range codes and add the expanded individual codes
                 corrected_data = pd.concat([corrected_data, new_rows_df], ignore_index=True)
-                
-                print(f"Added {len(new_rows)} new rows from expanded range codes")
-            
+
+                print(f"Added {len(new_rows_df)} new rows from expanded range codes")
+
         return corrected_data
     
     def build_hierarchy(self):
@@ -214,30 +317,32 @@ class NAICSParser:
         if self.naics_data is None:
             self.load_naics_data()
         
-        # Reset current state if rebuilding
+        # Reset current state if rebuilding (the child list would otherwise
+        # accumulate duplicates, where the old dict overwrote by code)
         self.all_nodes = {}
         self.code_aliases = {}
+        self.root.children = []
         
         # Sort data by code length to ensure parent nodes are processed first
         sorted_data = self.naics_data.copy()
-        # Add a column for code length (without dashes)
-        sorted_data['CodeLength'] = sorted_data['Code'].apply(lambda x: len(x.replace('-', '')))
+        # Add a column for code length (without dashes), vectorized
+        sorted_data['CodeLength'] = sorted_data['Code'].str.replace('-', '', regex=False).str.len()
         sorted_data = sorted_data.sort_values(by='CodeLength')
-        
-        # First pass: Add all nodes to the tree
-        for _, row in sorted_data.iterrows():
-            code = str(row['Code']).strip()
-            title = row['Title']
-            
+
+        # First pass: Add all nodes to the tree. Zipping the underlying
+        # arrays avoids boxing every row into a Series the way iterrows does.
+        for code, title in zip(sorted_data['Code'].to_numpy(),
+                               sorted_data['Title'].to_numpy()):
+
             # Skip invalid codes
             if not code or code == 'nan':
                 continue
             
-            # Create the node
+            # Create the node (codes were normalized once at load time)
             node = NAICSNode(code, title)
-            clean_code = code.replace(',', '').replace(' ', '')
+            clean_code = code
             self.all_nodes[clean_code] = node
-            
+
             # Handle range codes (e.g., "44-45")
             if '-' in clean_code and all(c.isdigit() or c == '-' for c in clean_code):
                 try:
@@ -268,29 +373,51 @@ class NAICSParser:
                 # Top-level sectors connect directly to root
                 self.root.add_child(node)
             else:
-                # Find the parent by looking at progressively shorter prefixes
-                parent_found = False
-                for i in range(len(code)-1, 0, -1):
-                    potential_parent_code = code[:i]
-                    
-                    # Check direct parent
-                    if potential_parent_code in self.all_nodes:
-                        self.all_nodes[potential_parent_code].add_child(node)
-                        parent_found = True
-                        break
-                    
-                    # Check if parent is aliased
-                    if potential_parent_code in self.code_aliases:
-                        canonical_code = self.code_aliases[potential_parent_code]
-                        self.all_nodes[canonical_code].add_child(node)
-                        parent_found = True
-                        break
-                
-                # If no parent found, attach to root
-                if not parent_found:
+                # NAICS parents are canonically one digit shorter (2 -> 3 ->
+                # 4 -> 5 -> 6), so the immediate prefix (or its range alias)
+                # resolves virtually every node in a single lookup
+                prefix = code[:-1]
+                parent = self.all_nodes.get(prefix)
+                if parent is None:
+                    canonical = self.code_aliases.get(prefix)
+                    if canonical is not None:
+                        parent = self.all_nodes[canonical]
+
+                # Rare gaps fall back to progressively shorter prefixes
+                if parent is None:
+                    for i in range(len(code)-2, 0, -1):
+                        potential_parent_code = code[:i]
+                        parent = self.all_nodes.get(potential_parent_code)
+                        if parent is None:
+                            canonical = self.code_aliases.get(potential_parent_code)
+                            if canonical is not None:
+                                parent = self.all_nodes[canonical]
+                        if parent is not None:
+                            break
+
+                if parent is not None:
+                    parent.add_child(node)
+                else:
+                    # If no parent found, attach to root
                     print(f"Warning: No parent found for {code}. Attaching to root.")
                     self.root.add_child(node)
         
+        # Finalization pass: children never change after the build, so the
+        # code-sorted dict list each query method hands out is computed once
+        # here instead of being rebuilt and re-sorted per request. The child
+        # lists themselves keep insertion order, which the traversal methods
+        # rely on.
+        for node in self.all_nodes.values():
+            node._children_dicts = sorted(
+                (child.to_dict() for child in node.children),
+                key=lambda child: child['code'])
+        self.root._children_dicts = sorted(
+            (child.to_dict() for child in self.root.children),
+            key=lambda child: child['code'])
+
+        # Derived lookup structures over the finished tree
+        self._index_tree()
+
         # Return stats about the built hierarchy
         return {
             'total_nodes': len(self.all_nodes),
@@ -298,6 +425,53 @@ class NAICSParser:
             'root_children': len(self.root.children)
         }
     
+    def _index_tree(self):
+        """
+        Build the derived lookup structures over a finished tree.
+
+        Runs after build_hierarchy and after a pickle reload. Produces the
+        sorted code list for prefix bisects plus a pre-order flattening of
+        the tree into parallel arrays: with pre-order numbering every
+        subtree is one contiguous slice, so descendant walks read straight
+        through a flat node list and an int32 depth array instead of
+        chasing child pointers node by node.
+        """
+        self._sorted_codes = sorted(self.all_nodes)
+        self._code_order = {code: rank for rank, code in enumerate(self.all_nodes)}
+
+        # Fold canonical codes and range aliases into one table per key
+        # type, so any code resolves with a single probe (direct codes
+        # shadow their alias entries, as the two-step lookup did). A packed
+        # digit-indexed array was considered here, but with ~2k codes a
+        # dict hit is already one memory access and the table would sit
+        # almost entirely empty.
+        self._resolved_nodes = {alias: self.all_nodes[canonical]
+                                for alias, canonical in self.code_aliases.items()}
+        self._resolved_nodes.update(self.all_nodes)
+        self._int_nodes = {int(code): node
+                           for code, node in self._resolved_nodes.items()
+                           if code.isdigit()}
+
+        preorder = []
+        depths = []
+        stack = [(self.root, 0, False)]
+        while stack:
+            node, depth, expanded = stack.pop()
+            if expanded:
+                node._pre_end = len(preorder)
+                continue
+            if node is not self.root:
+                preorder.append(node)
+                depths.append(depth)
+            node._pre_start = len(preorder)
+            node._pre_depth = depth
+            stack.append((node, depth, True))
+            stack.extend((child, depth + 1, False)
+                         for child in reversed(node.children))
+
+        self._preorder_nodes = preorder
+        self._pre_depths = np.asarray(depths, dtype=np.int32)
+
     def get_node(self, code):
         """
         Get a node by its code, handling aliases for range codes.
@@ -308,18 +482,20 @@ class NAICSParser:
         Returns:
             NAICSNode object or None if not found
         """
-        clean_code = str(code).strip().replace(',', '').replace(' ', '')
-        
-        # Direct lookup
-        if clean_code in self.all_nodes:
-            return self.all_nodes[clean_code]
-        
-        # Check if this is an aliased code
-        if clean_code in self.code_aliases:
-            canonical_code = self.code_aliases[clean_code]
-            return self.all_nodes.get(canonical_code)
-        
-        return None
+        # Fast path for ints straight from API routes: no string work at all
+        if isinstance(code, int):
+            return self._int_nodes.get(code)
+
+        clean_code = str(code).strip().translate(_CODE_JUNK)
+
+        # All-digit strings take the same int-keyed table (NAICS codes
+        # never carry leading zeros, so the guard keeps '044'-style input
+        # on the exact string path)
+        if clean_code.isdigit() and not clean_code.startswith('0'):
+            return self._int_nodes.get(int(clean_code))
+
+        # One probe resolves direct codes and range aliases alike
+        return self._resolved_nodes.get(clean_code)
     
     def get_code_info(self, code):
         """
@@ -340,21 +516,13 @@ class NAICSParser:
         path = node.get_path()
         path_info = [n.to_dict() for n in path if n.code != "ROOT"]
         
-        # Get children
-        children = []
-        for child_code, child_node in node.children.items():
-            children.append(child_node.to_dict())
-        
-        # Sort children by code
-        children.sort(key=lambda x: x['code'])
-        
         return {
             'code': node.code,
             'title': node.title,
             'is_range': node.is_range,
             'alternate_codes': node.alternate_codes,
             'path': path_info,
-            'children': children
+            'children': node._children_dicts    # Presorted by code at build time
         }
     
     def get_children(self, code):
@@ -371,14 +539,9 @@ class NAICSParser:
         node = self.get_node(code)
         if not node:
             return []
-        
-        children = []
-        for child_code, child_node in node.children.items():
-            children.append(child_node.to_dict())
-        
-        # Sort children by code
-        children.sort(key=lambda x: x['code'])
-        return children
+
+        # Presorted and cached by build_hierarchy's finalization pass
+        return node._children_dicts
     
     def get_descendants(self, code, max_depth=None):
         """
@@ -402,11 +565,23 @@ class NAICSParser:
         return [node.to_dict() for node in descendants]
     
     def _collect_descendants(self, node, result, max_depth, current_depth):
-        """Helper method for get_descendants"""
-        for child in node.children.values():
-            result.append(child)
-            if max_depth is None or current_depth < max_depth:
-                self._collect_descendants(child, result, max_depth, current_depth + 1)
+        """Helper method for get_descendants.
+
+        Reads the pre-order flattening built by _index_tree: a node's
+        descendants are exactly one contiguous slice of the flat array, so
+        an unbounded walk is a slice copy and a depth-limited one filters
+        that slice against the int32 depth array — no pointer chasing.
+        """
+        start, end = node._pre_start, node._pre_end
+        if max_depth is None:
+            result.extend(self._preorder_nodes[start:end])
+            return
+
+        # The recursive version expanded a node whenever its depth counter
+        # was still below max_depth, which admits one level past it
+        limit = node._pre_depth + max_depth + 1
+        within = np.nonzero(self._pre_depths[start:end] <= limit)[0]
+        result.extend(self._preorder_nodes[start + i] for i in within)
     
     def search_naics(self, query, max_results=100):
         """
@@ -427,22 +602,32 @@ class NAICSParser:
         
         query = query.lower()
         results = []
-        
+        seen = set()        # Codes already in results: dict-equality dedup was O(n^2)
+
         # Check for direct code match first
         node = self.get_node(query)
         if node:
             results.append(node.to_dict())
-        
-        # Check for code prefix match
-        code_prefix_matches = []
-        for code, node in self.all_nodes.items():
-            if code.startswith(query):
-                code_prefix_matches.append(node)
-        
-        # Sort code prefix matches by code length
-        code_prefix_matches.sort(key=lambda x: len(x.code))
+            seen.add(node.code)
+        
+        # Check for code prefix match: codes sharing the query prefix are a
+        # contiguous window of the sorted code list, found with two bisects
+        # instead of scanning every node
+        if query:
+            lo = bisect_left(self._sorted_codes, query)
+            hi = bisect_left(self._sorted_codes,
+                             query[:-1] + chr(ord(query[-1]) + 1), lo)
+            code_prefix_matches = [self.all_nodes[code]
+                                   for code in self._sorted_codes[lo:hi]]
+        else:
+            code_prefix_matches = list(self.all_nodes.values())
+
+        # Sort code prefix matches by code length; the insertion rank
+        # tie-break reproduces the stable order of the old full scan
+        code_prefix_matches.sort(key=lambda x: (len(x.code), self._code_order[x.code]))
         for node in code_prefix_matches[:max_results//2]:
-            if node.to_dict() not in results:  # Avoid duplicates
+            if node.code not in seen:  # Avoid duplicates
+                seen.add(node.code)
                 results.append(node.to_dict())
         
         # If we still have room, search by title
@@ -451,21 +636,37 @@ class NAICSParser:
             # If query was a numeric code, make title search more flexible
             if query.isdigit() and len(query) <= 6:
                 title_query = ""  # This will match everything
-                
-            matches = self.naics_data[
-                self.naics_data['Title'].str.lower().str.contains(title_query, na=False)
-            ]
-            
+
+            if not title_query:
+                rows = range(len(self._title_lower))
+            elif re.search(r'\W', title_query) is None:
+                # A word-character query can never span a token boundary, so
+                # scanning the (small) token vocabulary and unioning the
+                # postings is equivalent to a substring scan of every title
+                rows = sorted({
+                    row
+                    for token, postings in self._token_index.items()
+                    if title_query in token
+                    for row in postings
+                })
+            else:
+                # Queries with separators fall back to a substring scan of
+                # the cached lowercased titles. Lazy on purpose: the loop
+                # below stops consuming once max_results is reached, so the
+                # scan never visits the rest of the array
+                rows = (row for row, title in enumerate(self._title_lower)
+                        if title_query in title)
+
             # Convert matches to nodes
-            for _, row in matches.iterrows():
+            for row in rows:
                 if len(results) >= max_results:
                     break
-                    
-                code = str(row['Code']).strip()
-                node = self.get_node(code)
-                if node and node.to_dict() not in results:
+
+                node = self.get_node(self._search_codes[row])
+                if node and node.code not in seen:
+                    seen.add(node.code)
                     results.append(node.to_dict())
-        
+
         return results
     
     def get_industry_sectors(self):
@@ -476,8 +677,8 @@ class NAICSParser:
             list: List of top-level industry sectors in dictionary format.
         """
         sectors = []
-        for code, node in self.root.children.items():
-            if len(code.replace('-', '')) <= 2:  # Top-level sectors are 2-digit codes
+        for node in self.root.children:
+            if len(node.code.replace('-', '')) <= 2:  # Top-level sectors are 2-digit codes
                 sectors.append(node.to_dict())
         
         # Sort by code
@@ -557,29 +758,71 @@ class NAICSParser:
         Returns:
             dict: Dictionary representation of the NAICS tree
         """
-        def node_to_dict(node):
-            result = {
-                'code': node.code,
-                'title': node.title,
-                'is_range': node.is_range,
-                'alternate_codes': node.alternate_codes,
-                'children': {}
-            }
-            
-            for child_code, child in node.children.items():
-                result['children'][child_code] = node_to_dict(child)
-                
-            return result
-        
-        return node_to_dict(self.root)
-    
+        # Iterative post-order with an explicit stack: each node's dict is
+        # assembled from already-built children dicts, so exporting the full
+        # tree costs no Python recursion frames
+        built = {}
+        stack = [(self.root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if not expanded:
+                stack.append((node, True))
+                stack.extend((child, False) for child in node.children)
+            else:
+                built[id(node)] = {
+                    'code': node.code,
+                    'title': node.title,
+                    'is_range': node.is_range,
+                    'alternate_codes': node.alternate_codes,
+                    'children': {child.code: built[id(child)]
+                                 for child in node.children}
+                }
+
+        return built[id(self.root)]
+
     def export_to_json(self, filename=Config.NAICS_HIERARCHY_JSON_PATH):
         """
         Export the NAICS tree to a JSON file.
-        
+
         Args:
             filename (str): Path to save the JSON file
+
+        With orjson the document is streamed node by node: scalar payloads
+        are serialized individually and the nesting is emitted as raw
+        brace/key tokens into a 1 MiB-buffered binary file, so neither the
+        full nested dict nor its serialized bytes ever sit in memory at
+        once.
         """
-        import json
-        with open(filename, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
\ No newline at end of file
+        if orjson is None:
+            import json
+            with open(filename, 'w') as f:
+                json.dump(self.to_dict(), f, indent=2)
+            return
+
+        with open(filename, 'wb', buffering=1 << 20) as f:
+            # Explicit-stack pre-order emit; byte tokens on the stack close
+            # objects and separate siblings in the right order
+            stack = [self.root]
+            while stack:
+                item = stack.pop()
+                if isinstance(item, bytes):
+                    f.write(item)
+                    continue
+
+                payload = orjson.dumps({
+                    'code': item.code,
+                    'title': item.title,
+                    'is_range': item.is_range,
+                    'alternate_codes': item.alternate_codes,
+                })
+                # Splice an open children object into the node's payload
+                f.write(payload[:-1])
+                f.write(b',"children":{')
+
+                stack.append(b'}}')
+                children = item.children
+                for i in range(len(children) - 1, -1, -1):
+                    stack.append(children[i])
+                    stack.append(orjson.dumps(children[i].code) + b':')
+                    if i:
+                        stack.append(b',')
\ No newline at end of file
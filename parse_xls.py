@@ -1,28 +1,250 @@
+import os
+import zipfile
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 
-def parse_xls(path):
-    # Visit and familiarize yourself with https://iac.university/ to know the mission and activities of IACs 
+# xlsx namespaces used by the raw lxml reader
+_SSML = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_RELS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+
+def _load_shared_strings(zf):
+    # Parse xl/sharedStrings.xml exactly once into a flat list, so every
+    # t="s" cell resolves with a single integer index instead of walking
+    # the XML tree per cell.
+    from lxml import etree
+
+    shared = []
+    if 'xl/sharedStrings.xml' not in zf.namelist():
+        return shared
+
+    with zf.open('xl/sharedStrings.xml') as src:
+        for _, si in etree.iterparse(src, tag=f'{{{_SSML}}}si'):
+            shared.append(''.join(si.itertext()))
+            si.clear()
+    return shared
+
+def _column_index(cell_ref):
+    # "BC12" -> 0-based column 54
+    index = 0
+    for ch in cell_ref:
+        if ch.isdigit():
+            break
+        index = index * 26 + (ord(ch) - 64)
+    return index - 1
+
+def _cell_value(cell, shared):
+    value = cell.findtext(f'{{{_SSML}}}v')
+    cell_type = cell.get('t')
+    if cell_type == 's':
+        return shared[int(value)] if value is not None else None
+    if cell_type == 'inlineStr':
+        is_elem = cell.find(f'{{{_SSML}}}is')
+        return ''.join(is_elem.itertext()) if is_elem is not None else None
+    if value is None:
+        return None
+    if cell_type in ('str', 'e'):
+        return value
+    if cell_type == 'b':
+        return value == '1'
+    # Numeric cell: keep ints as ints where possible
+    number = float(value)
+    return int(number) if number.is_integer() else number
+
+def _iter_sheet_rows(zf, member, shared):
+    from lxml import etree
+
+    with zf.open(member) as src:
+        for _, row in etree.iterparse(src, tag=f'{{{_SSML}}}row'):
+            values = []
+            for cell in row.iterfind(f'{{{_SSML}}}c'):
+                ref = cell.get('r')
+                col = _column_index(ref) if ref else len(values)
+                # Pad gaps left by omitted empty cells
+                while len(values) < col:
+                    values.append(None)
+                values.append(_cell_value(cell, shared))
+            row.clear()
+            yield values
+
+def _parse_xlsx_lxml(path, sheet_names=None):
+    # Raw lxml reader: preloads the shared-string table once per workbook
+    # and streams rows straight out of the sheet XML, skipping the per-cell
+    # object layer entirely.
+    from lxml import etree
+
+    sheet_handler_object = {}
+
+    with zipfile.ZipFile(path) as zf:
+        shared = _load_shared_strings(zf)
+
+        # Map sheet names to their worksheet parts via the workbook rels
+        with zf.open('xl/_rels/workbook.xml.rels') as src:
+            rels = {
+                rel.get('Id'): rel.get('Target')
+                for rel in etree.parse(src).getroot()
+            }
+        with zf.open('xl/workbook.xml') as src:
+            workbook = etree.parse(src).getroot()
+
+        for sheet in workbook.iterfind(f'{{{_SSML}}}sheets/{{{_SSML}}}sheet'):
+            if sheet_names is not None and sheet.get('name') not in sheet_names:
+                continue
+            target = rels[sheet.get(f'{{{_RELS}}}id')].lstrip('/')
+            member = target if target.startswith('xl/') else 'xl/' + target
+
+            rows = _iter_sheet_rows(zf, member, shared)
+            header = next(rows, None)
+            if header is None:
+                sheet_handler_object[sheet.get('name')] = pd.DataFrame()
+                continue
+            data = list(rows)
+            # Rows can be ragged when trailing cells are empty: pad header
+            # and data rows alike, since writers omit trailing blanks from
+            # either side
+            width = max(len(header), max((len(r) for r in data), default=0))
+            header = list(header) + [None] * (width - len(header))
+            data = [r + [None] * (width - len(r)) for r in data]
+            sheet_handler_object[sheet.get('name')] = pd.DataFrame(data, columns=header)
+
+    return sheet_handler_object
+
+def _parse_xlsx(path, sheet_names=None):
+    # Stream the workbook instead of the default openpyxl load, which pulls
+    # styles/formulas for every cell into memory. read_only + data_only
+    # iterates raw cell values and is dramatically faster on large sheets.
+    from openpyxl import load_workbook
+
+    sheet_handler_object = {}
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for worksheet in workbook.worksheets:
+            if sheet_names is not None and worksheet.title not in sheet_names:
+                continue
+            rows = worksheet.iter_rows(values_only=True)
+            # First row is the header, matching pandas' default behavior
+            header = next(rows, None)
+            if header is None:
+                sheet_handler_object[worksheet.title] = pd.DataFrame()
+                continue
+            sheet_handler_object[worksheet.title] = pd.DataFrame(rows, columns=header)
+    finally:
+        workbook.close()
+
+    return sheet_handler_object
+
+def _parse_xls_sheet(path, sheet, cols):
+    # Parse one sheet of a legacy .xls workbook. on_demand means only this
+    # sheet's cell records are ever decoded, so independent sheets can be
+    # handed to separate worker processes.
+    import xlrd
+
+    book = xlrd.open_workbook(path, on_demand=True)
+    try:
+        with pd.ExcelFile(book, engine='xlrd') as workbook:
+            return workbook.parse(sheet, usecols=cols)
+    finally:
+        book.release_resources()
+
+# Parsed workbooks keyed by (path, mtime, requested sheets): static files
+# like the NAICS codes get re-read on every parser construction, so repeat
+# parses come straight from memory
+_parse_cache = {}
+
+def parse_xls(path, sheet_names=None, usecols=None):
+    # Visit and familiarize yourself with https://iac.university/ to know the mission and activities of IACs
     # Visit and familiarize yourself with https://iac.university/center/UC to know the work done by the UConn IAC
-    # Go to https://iac.university/#database to familiarize yourself with the IAC Database. 
+    # Go to https://iac.university/#database to familiarize yourself with the IAC Database.
     # Provided by https://iac.university/download/
-    # Go to https://iac.university/technical-documents and download the database manual, The ARC: Assessment Recommendation Code System. 
+    # Go to https://iac.university/technical-documents and download the database manual, The ARC: Assessment Recommendation Code System.
+
+    # Cache only the plain-parse case (usecols filters are unhashable and
+    # change the result shape); copies are handed out so callers can
+    # reshape the returned dict without poisoning the cache
+    cache_key = None
+    if usecols is None:
+        try:
+            stat = os.stat(path)
+            cache_key = (str(path), stat.st_mtime_ns,
+                         tuple(sheet_names) if sheet_names is not None else None)
+        except OSError:
+            pass
+        if cache_key in _parse_cache:
+            return dict(_parse_cache[cache_key])
 
-    # Dictionary that contains all sheets attributed to xls file
+    result = _parse_workbook(path, sheet_names, usecols)
+    if cache_key is not None and result is not None:
+        _parse_cache[cache_key] = dict(result)
+    return result
+
+def _parse_workbook(path, sheet_names, usecols):
+    # Dictionary that contains the requested sheets attributed to xls file
+    # (sheet_names=None parses every sheet; passing a collection skips the
+    # DataFrame conversion for everything else; usecols maps a sheet name
+    # to a pandas usecols filter so unwanted columns are dropped at parse
+    # time instead of being materialized and filtered later)
     sheet_handler_object = {}
-   
+
     try:
+        if str(path).endswith('.xlsx'):
+            # Fastest reader first: the Rust calamine engine when installed,
+            # then the raw lxml reader, then streaming openpyxl
+            try:
+                return pd.read_excel(path, engine='calamine',
+                                     sheet_name=list(sheet_names) if sheet_names is not None else None)
+            except ImportError:
+                pass
+            try:
+                return _parse_xlsx_lxml(path, sheet_names)
+            except ImportError:
+                return _parse_xlsx(path, sheet_names)
+
         # https://pandas.pydata.org/docs/reference/api/pandas.ExcelFile.html
-        # requires openpyxl
-        with pd.ExcelFile(path) as iac_df:
-            for i in iac_df.sheet_names:
-                sheet_handler_object.update({i: iac_df.parse(i)})
-            
+        # legacy .xls files still go through pandas (requires xlrd); the
+        # workbook is opened on demand so listing the sheets doesn't decode
+        # any cell data
+        import xlrd
+
+        book = xlrd.open_workbook(path, on_demand=True)
+        wanted = [i for i in book.sheet_names()
+                  if sheet_names is None or i in sheet_names]
+
+        # Independent sheets decode in parallel worker processes when there
+        # is more than one core to run them on (xlrd is pure Python, so
+        # threads would just serialize on the GIL); unpicklable usecols
+        # filters and the like fall back to the serial path below
+        workers = min(len(wanted), os.cpu_count() or 1)
+        if workers > 1:
+            book.release_resources()
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = [
+                        pool.submit(_parse_xls_sheet, path, i,
+                                    usecols.get(i) if usecols is not None else None)
+                        for i in wanted
+                    ]
+                    for i, future in zip(wanted, futures):
+                        sheet_handler_object.update({i: future.result()})
+                return sheet_handler_object
+            except Exception as e:
+                print("Parallel sheet parsing failed, parsing serially: ", e)
+                sheet_handler_object.clear()
+                book = xlrd.open_workbook(path, on_demand=True)
+
+        try:
+            with pd.ExcelFile(book, engine='xlrd') as workbook:
+                for i in wanted:
+                    cols = usecols.get(i) if usecols is not None else None
+                    sheet_handler_object.update({i: workbook.parse(i, usecols=cols)})
+        finally:
+            book.release_resources()
+
     except FileNotFoundError:
         print("File not found") # Check the the pathing of your IAC Database file
         return None
-    
+
     except Exception as e:
         print("An error occurred: ", e)
         return None
-    
-    return sheet_handler_object
\ No newline at end of file
+
+    return sheet_handler_object